@@ -1,10 +1,19 @@
-Input = list[tuple[int, int, int]]
+import sys
+from collections.abc import Iterable
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> Input:
-    with open(input_file, "r") as f:
-        lines = f.readlines()
-    return [tuple(map(int, line.split("x"))) for line in lines]
+from aoc.loader import iter_lines  # noqa: E402
+
+Input = Iterable[tuple[int, int, int]]
+
+
+def read_input(input_file, stream: bool = False) -> Input:
+    boxes = (
+        tuple(map(int, line.split("x"))) for line in iter_lines(input_file)
+    )
+    return boxes if stream else list(boxes)
 
 
 def paper_area(d1: int, d2: int, d3: int) -> int:
@@ -1,4 +1,9 @@
-import hashlib
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.md5 import mine  # noqa: E402
 
 
 def read_input(input_file) -> str:
@@ -6,25 +11,13 @@ def read_input(input_file) -> str:
         return f.read()
 
 
-def check_hash(n: int, input_string: str, starts_with: str = "00000") -> bool:
-    return (
-        hashlib.md5(f"{input_string}{n}".encode())
-        .hexdigest()
-        .startswith(starts_with)
-    )
-
-
 def part1(input_string: str) -> int:
-    n = 1
-    while not check_hash(n, input_string):
-        n += 1
+    n, _ = next(mine(input_string, zeros=5, start=1))
     return n
 
 
 def part2(input_string: str) -> int:
-    n = 1
-    while not check_hash(n, input_string, "000000"):
-        n += 1
+    n, _ = next(mine(input_string, zeros=6, start=1))
     return n
 
 
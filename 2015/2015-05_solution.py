@@ -1,9 +1,16 @@
+import sys
 from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> list[str]:
-    with open(input_file, "r") as f:
-        return f.readlines()
+from aoc.loader import iter_lines  # noqa: E402
+
+
+def read_input(input_file, stream: bool = False) -> Iterable[str]:
+    lines = iter_lines(input_file)
+    return lines if stream else list(lines)
 
 
 FORBIDDEN_SUBSTRINGS = {"ab", "cd", "pq", "xy"}
@@ -26,7 +33,7 @@ def is_nice(s: str) -> bool:
     return consecutive_pairs.isdisjoint(FORBIDDEN_SUBSTRINGS)
 
 
-def part1(input_strings: list[str]) -> int:
+def part1(input_strings: Iterable[str]) -> int:
     return sum(is_nice(s) for s in input_strings)
 
 
@@ -47,7 +54,7 @@ def is_very_nice(s: str) -> bool:
     return False
 
 
-def part2(input_strings: list[str]) -> int:
+def part2(input_strings: Iterable[str]) -> int:
     return sum(is_very_nice(s) for s in input_strings)
 
 
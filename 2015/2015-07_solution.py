@@ -1,84 +1,124 @@
 import operator
-from collections import defaultdict
-from dataclasses import dataclass, field
-from typing import Any, Callable, Literal
-
-BINARY_OPERATORS = {
-    "AND": operator.and_,
-    "OR": operator.or_,
-    "LSHIFT": operator.lshift,
-    "RSHIFT": operator.rshift,
-}
-
-
-@dataclass
-class Wire:
-    name: str
-    inputs: list["Wire"] = field(default_factory=list)
-    operator: Literal["AND", "OR", "LSHIFT", "RSHIFT", "NOT", ""] = ""
-    _value: int | None = None
-
-    def value(self) -> int:
-        if self._value is None:
-            try:
-                self._value = int(self.name)
-            except ValueError:
-                match self.operator:
-                    case "":
-                        self._value = self.inputs[0].value()
-                    case "NOT":
-                        self._value = ~self.inputs[0].value()
-                    case _:
-                        self._value = BINARY_OPERATORS[self.operator](
-                            self.inputs[0].value(), self.inputs[1].value()
-                        )
-        return self._value
-
-
-class DefaultDictKey(defaultdict):
-    default_factory: Callable[[], Any]
-
-    def __missing__(self, key):
-        self[key] = self.default_factory(key)
-        return self[key]
-
-
-@dataclass
-class Circuit:
-    wires: dict[str, Wire] = field(
-        default_factory=lambda: DefaultDictKey(Wire)
-    )
+from collections import deque
+from collections.abc import Iterable
 
-    def evaluate(self, wire: str = "a") -> int:
-        return self.wires[wire].value()
+MASK = 0xFFFF
 
-    def add_wire(self, instruction: str) -> None:
-        input_string, output = instruction.split(" -> ")
+# gates are compiled to (op, src1, src2, dst), where op indexes OPERATIONS and
+# the others index Circuit.values; unary gates read src1 only
+OPERATORS = ("", "NOT", "AND", "OR", "LSHIFT", "RSHIFT")
+OPERATIONS = (
+    lambda a, _: a,
+    lambda a, _: ~a & MASK,
+    operator.and_,
+    operator.or_,
+    lambda a, b: (a << b) & MASK,
+    operator.rshift,
+)
+Gate = tuple[int, int, int, int]
 
+
+class Circuit:
+    def __init__(self, instructions: Iterable[str]) -> None:
+        # a slot per wire, and per constant, holding its value
+        self.slots: dict[str, int] = {}
+        self.values: list[int] = []
+        gates = [self.compile(i) for i in instructions]
+        driven = {dst for *_, dst in gates}
+        undriven = [
+            name
+            for name, slot in self.slots.items()
+            if not name.isdigit() and slot not in driven
+        ]
+        if undriven:
+            raise ValueError(f"Wires without input: {', '.join(undriven)}")
+        self.gates = self.sort(gates)
+        # positions in gates of the gates reading each slot
+        self.readers: list[list[int]] = [[] for _ in self.values]
+        for k, (_, a, b, _) in enumerate(self.gates):
+            self.readers[a].append(k)
+            if b != a:
+                self.readers[b].append(k)
+        self.overrides: dict[int, int] = {}
+        self.run(range(len(self.gates)))
+
+    def slot(self, name: str) -> int:
+        if name not in self.slots:
+            self.slots[name] = len(self.values)
+            self.values.append(int(name) & MASK if name.isdigit() else 0)
+        return self.slots[name]
+
+    def compile(self, instruction: str) -> Gate:
+        input_string, output = instruction.split(" -> ")
         match input_string.split():
             case [input]:
-                inputs = [self.wires[input]]
-                operator = ""
+                op, inputs = "", [input, input]
             case ["NOT", input]:
-                inputs = [self.wires[input]]
-                operator = "NOT"
-            case [input1, operator, input2]:
-                inputs = [self.wires[input1], self.wires[input2]]
-
-        self.wires[output].inputs = inputs
-        self.wires[output].operator = operator
+                op, inputs = "NOT", [input, input]
+            case [input1, op, input2]:
+                inputs = [input1, input2]
+            case _:
+                raise ValueError(f"Invalid instruction: {instruction}")
+        a, b = map(self.slot, inputs)
+        return OPERATORS.index(op), a, b, self.slot(output)
+
+    def sort(self, gates: list[Gate]) -> list[Gate]:
+        # topologically, so that one pass in order computes every wire
+        driven = {dst for *_, dst in gates}
+        waiting = [len({a, b} & driven) for _, a, b, _ in gates]
+        readers: dict[int, list[int]] = {}
+        for k, (_, a, b, _) in enumerate(gates):
+            for src in {a, b} & driven:
+                readers.setdefault(src, []).append(k)
+        ready = deque(k for k, n in enumerate(waiting) if n == 0)
+        order = []
+        while ready:
+            k = ready.popleft()
+            order.append(gates[k])
+            for reader in readers.get(gates[k][3], []):
+                waiting[reader] -= 1
+                if waiting[reader] == 0:
+                    ready.append(reader)
+        if len(order) != len(gates):
+            raise ValueError("The circuit has a loop")
+        return order
+
+    def run(self, positions: Iterable[int]) -> None:
+        values = self.values
+        for k in positions:
+            op, a, b, dst = self.gates[k]
+            if dst not in self.overrides:
+                values[dst] = OPERATIONS[op](values[a], values[b])
+
+    def downstream(self, slot: int) -> list[int]:
+        # positions of the gates depending on the slot, in order
+        cone: set[int] = set()
+        todo = [slot]
+        while todo:
+            for k in self.readers[todo.pop()]:
+                if k not in cone:
+                    cone.add(k)
+                    todo.append(self.gates[k][3])
+        return sorted(cone)
+
+    def override(self, wire: str, value: int) -> None:
+        # the wire takes the value instead of its input, and only the gates
+        # downstream are computed again
+        slot = self.slots[wire]
+        self.overrides[slot] = self.values[slot] = value & MASK
+        self.run(self.downstream(slot))
 
     def reset(self) -> None:
-        for wire in self.wires.values():
-            wire._value = None
+        self.overrides.clear()
+        self.run(range(len(self.gates)))
+
+    def evaluate(self, wire: str = "a") -> int:
+        return self.values[self.slots[wire]]
 
 
 def read_input(input_file) -> Circuit:
-    circuit = Circuit()
     with open(input_file, "r") as f:
-        for line in f:
-            circuit.add_wire(line.strip())
-    return circuit
+        return Circuit(line.strip() for line in f)
 
 
 def part1(circuit: Circuit) -> int:
@@ -86,9 +126,8 @@ def part1(circuit: Circuit) -> int:
 
 
 def part2(circuit: Circuit) -> int:
-    value_a = circuit.evaluate()
     circuit.reset()
-    circuit.wires["b"]._value = value_a
+    circuit.override("b", circuit.evaluate())
     return circuit.evaluate()
 
 
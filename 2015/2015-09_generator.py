@@ -0,0 +1,15 @@
+import random
+from itertools import combinations
+
+
+SIZES = (4, 6, 8, 10, 12, 14, 16)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # distances between every pair of size locations
+    rng = random.Random(seed)
+    locations = [f"Location{i}" for i in range(size)]
+    return "".join(
+        f"{a} to {b} = {rng.randint(1, 150)}\n"
+        for a, b in combinations(locations, 2)
+    )
@@ -1,5 +1,15 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass, field
-from itertools import permutations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.tsp import held_karp  # noqa: E402
+
+np = lazy_import("numpy")
 
 
 @dataclass
@@ -22,15 +32,23 @@ class DistanceMap:
             for i in range(len(path) - 1)
         )
 
-    def shortest_path(self) -> int:
-        return min(
-            self.path_length(path) for path in permutations(self.locations)
+    def matrix(self) -> np.ndarray:
+        # with inf for pairs of locations without a road
+        locations = sorted(self.locations)
+        matrix = np.array(
+            [
+                [self.distances.get((a, b), np.inf) for b in locations]
+                for a in locations
+            ]
         )
+        np.fill_diagonal(matrix, 0)
+        return matrix
+
+    def shortest_path(self) -> int:
+        return held_karp(self.matrix())
 
     def longest_path(self) -> int:
-        return max(
-            self.path_length(path) for path in permutations(self.locations)
-        )
+        return held_karp(self.matrix(), maximize=True)
 
 
 def read_input(input_file) -> DistanceMap:
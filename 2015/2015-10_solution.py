@@ -1,28 +1,157 @@
+from __future__ import annotations
+
+import sys
+from functools import cache
+from itertools import groupby
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
 INPUT = "1113122113"
 
+# steps after which a sequence splits into elements
+AGE = 2
+
+
+def look_and_say(digits: bytes) -> bytearray:
+    # direct mode: the digit values, run-length encoded into the next ones
+    said = bytearray()
+    for digit, run in groupby(digits):
+        said.append(sum(1 for _ in run))
+        said.append(digit)
+    return said
+
+
+def runs(digits: bytes) -> list[tuple[int, int]]:
+    # (digit, length) of each run
+    return [(digit, sum(1 for _ in run)) for digit, run in groupby(digits)]
+
+
+def begins_split(right: list[tuple[int, int]]) -> bool:
+    # whether the runs begin with 1 X, 111, 3 X^(not 3 times), n (n >= 4) or
+    # are empty, where single letters stand for runs of length 1
+    if not right:
+        return True
+    (digit, length), rest = right[0], right[1:]
+    match digit, length:
+        case 1, 1:
+            return bool(rest) and rest[0][1] == 1
+        case 1, 3:
+            return True
+        case 3, 1:
+            return not rest or rest[0][1] != 3
+        case n, 1:
+            return n >= 4
+    return False
+
+
+def splits(last: int, right: bytes) -> bool:
+    # Conway's splitting theorem, for sequences at least two steps old: a
+    # sequence ending in last and followed by right evolves independently
+    # of it if
+    # - last >= 4 and right starts with a digit <= 3, or
+    # - last == 2 and right begins as in begins_split, or
+    # - last != 2 and right begins with 22 and then as in begins_split.
+    if last >= 4 and right[0] <= 3:
+        return True
+    # runs are at most 3 long, so the first three fit in 10 digits
+    right_runs = runs(right[:10])
+    if last == 2:
+        return begins_split(right_runs)
+    return right_runs[0] == (2, 2) and begins_split(right_runs[1:])
+
+
+def split(digits: bytes) -> list[bytes]:
+    # into Conway's elements, which evolve independently of each other; the
+    # sequence must be at least two steps old
+    elements = []
+    start = 0
+    for i in range(1, len(digits)):
+        if digits[i] != digits[i - 1] and splits(digits[i - 1], digits[i:]):
+            elements.append(bytes(digits[start:i]))
+            start = i
+    elements.append(bytes(digits[start:]))
+    return elements
+
+
+@cache
+def decay(element: bytes) -> list[bytes]:
+    return split(look_and_say(element))
+
+
+class Conway:
+    # the sequence as counts of Conway's elements, those reachable from the
+    # start (the 92 of them for the puzzle input), with a sparse transition
+    # matrix: the indices of the elements each element decays into. The
+    # first steps are computed directly, as only sequences at least two
+    # steps old split by the theorem.
+    def __init__(self, start: str) -> None:
+        self.early = [bytes(int(c) for c in start)]
+        for _ in range(AGE):
+            self.early.append(bytes(look_and_say(self.early[-1])))
+        self.start = split(self.early[-1])
+        self.elements: list[bytes] = []
+        self.index: dict[bytes, int] = {}
+        todo = list(self.start)
+        while todo:
+            element = todo.pop()
+            if element not in self.index:
+                self.index[element] = len(self.elements)
+                self.elements.append(element)
+                todo.extend(decay(element))
+        self.transitions = [
+            [self.index[e] for e in decay(element)]
+            for element in self.elements
+        ]
+        self.lengths = [len(element) for element in self.elements]
+
+    def counts(self, n: int) -> list[int]:
+        # after n >= AGE steps, in O(92 * n)
+        if n < AGE:
+            raise ValueError(f"Element counts start at step {AGE}")
+        counts = [0] * len(self.elements)
+        for element in self.start:
+            counts[self.index[element]] += 1
+        for _ in range(n - AGE):
+            new_counts = [0] * len(counts)
+            for i, count in enumerate(counts):
+                if count:
+                    for j in self.transitions[i]:
+                        new_counts[j] += count
+            counts = new_counts
+        return counts
+
+    def matrix(self) -> np.ndarray:
+        # python ints, which don't overflow
+        m = np.zeros((len(self.elements),) * 2, dtype=object)
+        for i, targets in enumerate(self.transitions):
+            for j in targets:
+                m[j, i] += 1
+        return m
 
-def look_and_say(s: str) -> str:
-    k = 0
-    new_string = ""
-    while k < len(s):
-        c = 1
-        while k + c < len(s) and s[k + c] == s[k]:
-            c += 1
-        new_string += str(c) + s[k]
-        k += c
-    return new_string
+    def length(self, n: int, by_squaring: bool = False) -> int:
+        # in O(92**2 * log n) matrix products if by squaring
+        if n < AGE:
+            return len(self.early[n])
+        if not by_squaring:
+            return sum(map(int.__mul__, self.counts(n), self.lengths))
+        counts = np.zeros(len(self.elements), dtype=object)
+        for element in self.start:
+            counts[self.index[element]] += 1
+        counts = np.linalg.matrix_power(self.matrix(), n - AGE) @ counts
+        return int(np.dot(self.lengths, counts))
 
 
-def part1(s: str) -> int:
-    for _ in range(40):
-        s = look_and_say(s)
-    return len(s)
+def part1(s: str, n: int = 40) -> int:
+    return Conway(s).length(n)
 
 
-def part2(s: str) -> int:
-    for _ in range(50):
-        s = look_and_say(s)
-    return len(s)
+def part2(s: str, n: int = 50) -> int:
+    return Conway(s).length(n)
 
 
 def main() -> None:
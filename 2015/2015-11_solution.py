@@ -1,83 +1,69 @@
+from collections.abc import Iterator
+from functools import cache
+from itertools import islice
+
 INPUT = "hepxcrrq"
 
 FORBIDDEN_CHARS = set(ord(c) - ord("a") for c in "iol")
-
-
-def increment_char(c: int) -> tuple[chr, bool]:
-    match c:
-        case 25:
-            return 0, True
-        case c if c in (7, 10, 13):
-            return c + 2, False
-        case _:
-            return c + 1, False
-
-
-class Password:
-    len = 8
-    forbidden = set(ord(c) - ord("a") for c in "iol")
-
-    def __init__(self, s: str) -> None:
-        assert len(s) == self.len
-        self.chars = [ord(c) - ord("a") for c in s]
-
-    @property
-    def s(self) -> str:
-        return "".join(chr(c + ord("a")) for c in self.chars)
-
-    @property
-    def value(self) -> int:
-        return sum(c * 26**i for i, c in enumerate(reversed(self.chars)))
-
-    def increment(self) -> None:
-        i = self.len - 1
-        carry = True
-        while carry:
-            self.chars[i], carry = increment_char(self.chars[i])
-            i -= 1
-
-    def has_increasing_triple(self) -> bool:
-        for i in range(self.len - 2):
-            if (
-                self.chars[i + 1] == self.chars[i] + 1
-                and self.chars[i + 2] == self.chars[i] + 2
-            ):
-                return True
-        return False
-
-    def has_two_pairs(self) -> bool:
-        pairs = set()
-        for i in range(self.len - 1):
-            if self.chars[i] == self.chars[i + 1]:
-                pairs.add(self.chars[i])
-        return len(pairs) >= 2
-
-    def is_valid(self) -> bool:
-        return (
-            not self.forbidden.intersection(self.chars)
-            and self.has_increasing_triple()
-            and self.has_two_pairs()
-        )
-
-    def find_next_valid(self) -> None:
-        k = 1
-        self.increment()
-        while not self.is_valid():
-            k += 1
-            self.increment()
+ALLOWED_CHARS = [c for c in range(26) if c not in FORBIDDEN_CHARS]
+
+# (char before last, last char, has a straight, letters of pairs) of a prefix,
+# with sentinels that can't start a straight or a pair
+State = tuple[int, int, bool, frozenset[int]]
+START: State = (-2, -2, False, frozenset())
+
+
+def advance(state: State, c: int) -> State:
+    before, last, straight, pairs = state
+    straight = straight or before + 2 == last + 1 == c
+    if c == last and len(pairs) < 2:
+        pairs = pairs | {c}
+    return last, c, straight, pairs
+
+
+@cache
+def completable(state: State, remaining: int) -> bool:
+    # whether some suffix of the given length makes a valid password
+    if state[2] and len(state[3]) >= 2:
+        return True
+    return remaining > 0 and any(
+        completable(advance(state, c), remaining - 1) for c in ALLOWED_CHARS
+    )
+
+
+def valid_after(s: str) -> Iterator[str]:
+    # The valid passwords after s, in order, by a depth first search over
+    # prefixes that skips those no suffix can complete: forbidden letters are
+    # never tried, so a whole block is jumped past at once, and the first
+    # password found with a prefix has the smallest suffix completing it.
+    chars = [ord(c) - ord("a") for c in s]
+
+    def search(i: int, state: State, tight: bool) -> Iterator[list[int]]:
+        # tight while the prefix is the same as that of s
+        if i == len(chars):
+            if not tight:
+                yield []
+            return
+        for c in ALLOWED_CHARS:
+            if tight and c < chars[i]:
+                continue
+            new_state = advance(state, c)
+            if completable(new_state, len(chars) - i - 1):
+                for suffix in search(
+                    i + 1, new_state, tight and c == chars[i]
+                ):
+                    yield [c, *suffix]
+
+    for password in search(0, START, True):
+        yield "".join(chr(c + ord("a")) for c in password)
 
 
 def part1(s: str) -> str:
-    password = Password(s)
-    password.find_next_valid()
-    return password.s
+    return next(valid_after(s))
 
 
 def part2(s: str) -> str:
-    password = Password(s)
-    password.find_next_valid()
-    password.find_next_valid()
-    return password.s
+    return list(islice(valid_after(s), 2))[-1]
 
 
 def main() -> None:
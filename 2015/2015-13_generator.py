@@ -0,0 +1,20 @@
+import random
+from itertools import permutations
+
+
+SIZES = (4, 6, 8, 10, 12, 14, 16)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # what each of size guests thinks of sitting next to each other guest
+    rng = random.Random(seed)
+    guests = [f"Guest{i}" for i in range(size)]
+    lines = []
+    for a, b in permutations(guests, 2):
+        units = rng.randint(-100, 100)
+        change = "gain" if units >= 0 else "lose"
+        lines.append(
+            f"{a} would {change} {abs(units)} happiness units "
+            f"by sitting next to {b}.\n"
+        )
+    return "".join(lines)
@@ -1,50 +1,46 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass, field
-from itertools import permutations
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.tsp import held_karp  # noqa: E402
 
-class Table(list[str]):
-    def __getitem__(self, idx: int) -> str:
-        return super().__getitem__(idx % len(self))
+np = lazy_import("numpy")
 
 
 @dataclass
 class Party:
     guests: set[str] = field(default_factory=set)
     happiness: dict[str, dict[str, int]] = field(default_factory=dict)
+    # guests by index, and the happiness of each pair sitting side by side
+    names: list[str] = field(init=False)
+    matrix: np.ndarray = field(init=False)
 
     def __post_init__(self) -> None:
         assert set(self.happiness) == self.guests
         for guest, values in self.happiness.items():
             assert set(values).union({guest}) == self.guests
             assert guest not in values
-
-    def evaluate_table(self, table: Table) -> int:
-        assert set(table) == self.guests
-        happiness = 0
-        for i, guest in enumerate(table):
-            happiness += self.happiness[guest][table[i - 1]]
-            happiness += self.happiness[guest][table[i + 1]]
-        return happiness
+        self.names = sorted(self.guests)
+        h = np.array(
+            [
+                [self.happiness[a].get(b, 0) for b in self.names]
+                for a in self.names
+            ],
+            dtype=np.int64,
+        )
+        self.matrix = h + h.T
 
     def find_max_happiness(self) -> int:
-        fixed, *rotating = self.guests
-        tables = (Table([fixed] + list(p)) for p in permutations(rotating))
-        return max(self.evaluate_table(t) for t in tables)
-
-    def evaluate_list(self, guests: list[str]) -> int:
-        assert set(guests) == self.guests
-        happiness = 0
-        for i, guest in enumerate(guests):
-            if i > 0:
-                happiness += self.happiness[guest][guests[i - 1]]
-            if i < len(guests) - 1:
-                happiness += self.happiness[guest][guests[i + 1]]
-        return happiness
+        return held_karp(self.matrix, cycle=True, maximize=True)
 
     def find_max_happiness2(self) -> int:
-        return max(
-            self.evaluate_list(list(p)) for p in permutations(self.guests)
-        )
+        # with a neutral guest at the table, the best open line of the others
+        return held_karp(self.matrix, maximize=True)
 
 
 def parse_line(line: str) -> tuple[str, str, int]:
@@ -1,3 +1,5 @@
+from functools import cache
+
 import tqdm
 
 
@@ -9,7 +11,8 @@ def read_input(input_file) -> list[int]:
 TOTAL_VOLUME = 150
 
 
-def find_combinations(sizes: list[int]) -> list[list[int]]:
+@cache
+def find_combinations(sizes: tuple[int, ...]) -> list[list[int]]:
     combinations = []
     n = len(sizes)
     for i in tqdm.trange(2**n):
@@ -20,11 +23,12 @@ def find_combinations(sizes: list[int]) -> list[list[int]]:
     return combinations
 
 
-def part1(combinations: list[list[int]]) -> int:
-    return len(combinations)
+def part1(sizes: list[int]) -> int:
+    return len(find_combinations(tuple(sizes)))
 
 
-def part2(combinations: list[list[int]]) -> int:
+def part2(sizes: list[int]) -> int:
+    combinations = find_combinations(tuple(sizes))
     n_containers = [sum(x) for x in combinations]
     min_containers = min(n_containers)
     return n_containers.count(min_containers)
@@ -32,14 +36,13 @@ def part2(combinations: list[list[int]]) -> int:
 
 def main() -> None:
     sizes = read_input("2015-17_input.txt")
-    combinations = find_combinations(sizes)
     print("Part 1: ")
     print("-------")
-    print(part1(combinations))
+    print(part1(sizes))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(combinations))
+    print(part2(sizes))
     print("=======\n")
 
 
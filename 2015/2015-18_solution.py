@@ -1,60 +1,47 @@
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 import tqdm
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid, neighbour_counts  # noqa: E402
+
 
 @dataclass
 class Lights:
-    grid: list[list[bool]]
+    grid: Grid
 
     def __post_init__(self) -> None:
-        assert all(len(row) == len(self.grid) for row in self.grid)
+        assert self.grid.height == self.grid.width
 
     @property
     def n(self) -> int:
-        return len(self.grid)
+        return self.grid.height
 
     def print(self) -> None:
         for row in self.grid:
             print("".join("#" if c else "." for c in row))
         print()
 
-    def neighbours(self, i: int, j: int) -> int:
-        n_x = [i]
-        n_y = [j]
-        if i > 0:
-            n_x.append(i - 1)
-        if i < self.n - 1:
-            n_x.append(i + 1)
-        if j > 0:
-            n_y.append(j - 1)
-        if j < self.n - 1:
-            n_y.append(j + 1)
-        return sum(self.grid[x][y] for x in n_x for y in n_y) - self.grid[i][j]
-
     def update(self, fixed: bool = False) -> "Lights":
-        new_grid = [[False] * self.n for _ in range(self.n)]
-        for i in range(self.n):
-            for j in range(self.n):
-                if self.grid[i][j]:
-                    new_grid[i][j] = self.neighbours(i, j) in (2, 3)
-                else:
-                    new_grid[i][j] = self.neighbours(i, j) == 3
+        neighbours = neighbour_counts(self.grid.cells)
+        on = (neighbours == 3) | (
+            self.grid.cells.astype(bool) & (neighbours == 2)
+        )
         if fixed:
-            new_grid[0][0] = True
-            new_grid[0][self.n - 1] = True
-            new_grid[self.n - 1][0] = True
-            new_grid[self.n - 1][self.n - 1] = True
-        return Lights(new_grid)
+            on[[0, 0, -1, -1], [0, -1, 0, -1]] = True
+        return Lights(Grid(on))
 
     def count_on(self) -> int:
-        return sum(sum(r) for r in self.grid)
+        return int(self.grid.cells.sum())
 
 
 def read_input(input_file) -> Lights:
     with open(input_file, "r") as f:
-        grid = [[c == "#" for c in line.strip()] for line in f]
-    return Lights(grid)
+        grid = Grid.from_lines(line.strip() for line in f)
+    return Lights(Grid(grid.mask("#")))
 
 
 def part1(lights: Lights) -> int:
@@ -73,8 +73,8 @@ class Player:
         )
 
 
-def parse_input(
-    input: str, shop_str: str
+def read_input(
+    input: str, shop_str: str = SHOP
 ) -> tuple[Player, dict[str, list[Item]]]:
     boss = Player(*(int(line.split(": ")[1]) for line in input.splitlines()))
     shop = {}
@@ -117,7 +117,7 @@ def part2(boss: Player, shop: dict[str, list[Item]]) -> int:
 
 
 def main() -> None:
-    boss, shop = parse_input(INPUT, SHOP)
+    boss, shop = read_input(INPUT)
     print("Part 1: ")
     print("-------")
     print(part1(boss, shop))
@@ -119,8 +119,6 @@ def part1() -> int:
     min_mana_winner = math.inf
     w = Wizard()
     games = [w]
-    n_leaves = 0
-    n_wins = 0
     while games:
         w = games.pop()
         for spell in w.spells:
@@ -128,9 +126,8 @@ def part1() -> int:
                 next = deepcopy(w)
                 next.turn(spell)
             except SpellNotAllowed:
-                n_leaves += 1
+                pass
             except Win:
-                n_wins += 1
                 min_mana_winner = min(min_mana_winner, next._mana_spent)
             else:
                 if next._mana_spent < min_mana_winner:
@@ -142,8 +139,6 @@ def part2() -> int:
     min_mana_winner = math.inf
     w = Wizard(hard=True)
     games = [w]
-    n_leaves = 0
-    n_wins = 0
     while games:
         w = games.pop()
         for spell in w.spells:
@@ -151,9 +146,8 @@ def part2() -> int:
                 next = deepcopy(w)
                 next.turn(spell)
             except SpellNotAllowed:
-                n_leaves += 1
+                pass
             except Win:
-                n_wins += 1
                 min_mana_winner = min(min_mana_winner, next._mana_spent)
             else:
                 if next._mana_spent < min_mana_winner:
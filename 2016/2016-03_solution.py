@@ -1,12 +1,20 @@
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.loader import iter_lines  # noqa: E402
+
 Triangle = tuple[int, int, int]
 
 
-def read_input(input_file) -> list[Triangle]:
-    with open(input_file) as f:
-        return [tuple(map(int, line.split())) for line in f.readlines()]
+def read_input(input_file, stream: bool = False) -> Iterable[Triangle]:
+    rows = (tuple(map(int, line.split())) for line in iter_lines(input_file))
+    return rows if stream else list(rows)
 
 
-def part1(input: list[Triangle]) -> int:
+def part1(input: Iterable[Triangle]) -> int:
     c = 0
     for t in input:
         longest, *other = sorted(t, reverse=True)
@@ -15,12 +23,12 @@ def part1(input: list[Triangle]) -> int:
     return c
 
 
-def part2(input: list[Triangle]) -> int:
-    actual_triangles = [
-        (input[i][c], input[i + 1][c], input[i + 2][c])
-        for i in range(0, len(input) - 2, 3)
-        for c in range(3)
-    ]
+def part2(input: Iterable[Triangle]) -> int:
+    rows = iter(input)
+    # triangles are read down the columns of each group of three rows
+    actual_triangles = (
+        triangle for group in zip(rows, rows, rows) for triangle in zip(*group)
+    )
     return part1(actual_triangles)
 
 
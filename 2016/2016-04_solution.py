@@ -1,10 +1,12 @@
+import sys
 from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> list[str]:
-    with open(input_file) as f:
-        return f.readlines()
+from aoc.loader import iter_lines  # noqa: E402
 
 
 def calculate_checksum(name: str) -> str:
@@ -26,7 +28,7 @@ class Room:
     def from_string(cls, string: str) -> "Room":
         name, id_checksum = string.rsplit("-", 1)
         id, checksum = id_checksum.split("[")
-        return cls(name, int(id), checksum[:-2])
+        return cls(name, int(id), checksum[:-1])
 
     def validate(self) -> bool:
         return self.checksum == calculate_checksum(self.name)
@@ -42,18 +44,21 @@ class Room:
         return decripted
 
 
-def part1(input: list[str]) -> int:
+def read_input(input_file, stream: bool = False) -> Iterable[Room]:
+    rooms = (Room.from_string(line) for line in iter_lines(input_file))
+    return rooms if stream else list(rooms)
+
+
+def part1(input: Iterable[Room]) -> int:
     total = 0
-    for line in input:
-        room = Room.from_string(line)
+    for room in input:
         if room.validate():
             total += room.id
     return total
 
 
-def part2(input: list[str]) -> int:
-    rooms = [Room.from_string(line) for line in input]
-    [room] = [r for r in rooms if r.validate() and "north" in r.decript()]
+def part2(input: Iterable[Room]) -> int:
+    [room] = [r for r in input if r.validate() and "north" in r.decript()]
     return room.id
 
 
@@ -1,6 +1,11 @@
-import hashlib
+import sys
+from contextlib import closing
+from itertools import islice
+from pathlib import Path
 
-import tqdm
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.md5 import mine  # noqa: E402
 
 
 def read_input(input_file) -> str:
@@ -10,34 +15,19 @@ def read_input(input_file) -> str:
 
 
 def part1(input: str) -> str:
-    password = ""
-    i = 0
-    pbar = tqdm.tqdm(total=8)
-    while len(password) < 8:
-        hash = hashlib.md5(f"{input}{i}".encode()).hexdigest()
-        if hash.startswith("00000"):
-            password += hash[5]
-            pbar.update()
-        i += 1
-    return password
+    with closing(mine(input, zeros=5)) as hits:
+        return "".join(digest.hex()[5] for _, digest in islice(hits, 8))
 
 
 def part2(input: str) -> str:
     password = [None] * 8
-    i = 0
-    pbar = tqdm.tqdm(total=8)
-    while None in password:
-        hash = hashlib.md5(f"{input}{i}".encode()).hexdigest()
-        if hash.startswith("00000"):
-            try:
-                position = int(hash[5])
-            except ValueError:
-                pass
-            else:
-                if position < 8 and password[position] is None:
-                    password[position] = hash[6]
-                    pbar.update()
-        i += 1
+    with closing(mine(input, zeros=5)) as hits:
+        while None in password:
+            _, digest = next(hits)
+            # sixth hex digit, then the seventh
+            position, character = digest[2] & 0xF, digest.hex()[6]
+            if position < 8 and password[position] is None:
+                password[position] = character
     return "".join(password)
 
 
@@ -1,22 +1,13 @@
-def read_input(input_file) -> list[str]:
-    with open(input_file) as f:
-        return f.read().splitlines()
+import sys
+from collections.abc import Iterable
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def has_abba(s: str) -> bool:
-    assert set("[]").intersection(s) == set()
-    for a, b, c, d in zip(s, s[1:], s[2:], s[3:]):
-        if a != b and a == d and b == c:
-            return True
-    return False
-
+from aoc.loader import cached_parse, iter_lines, read_lines  # noqa: E402
 
-def supports_tls(s: str) -> bool:
-    words = s.replace("[", "]").split("]")
-    # odd elements are inside brackets
-    if any(has_abba(hypernet) for hypernet in words[1::2]):
-        return False
-    return any(has_abba(word) for word in words[::2])
+# (supernet sequences, hypernet sequences)
+Address = tuple[tuple[str, ...], tuple[str, ...]]
 
 
 def match_brackets(s: str) -> bool:
@@ -33,10 +24,38 @@ def match_brackets(s: str) -> bool:
     return all(o < c for o, c in zip(open_idx, closed_idx))
 
 
-def part1(input: list[str]) -> int:
-    for s in input:
-        assert match_brackets(s)
-    return sum(supports_tls(s) for s in input)
+def parse_address(s: str) -> Address:
+    assert match_brackets(s)
+    words = s.replace("[", "]").split("]")
+    # odd elements are inside brackets
+    return tuple(words[::2]), tuple(words[1::2])
+
+
+@cached_parse
+def read_input(input_file, stream: bool = False) -> Iterable[Address]:
+    # streamed records bypass the parse cache
+    if stream:
+        return (parse_address(line) for line in iter_lines(input_file))
+    return [parse_address(line) for line in read_lines(input_file)]
+
+
+def has_abba(s: str) -> bool:
+    assert set("[]").intersection(s) == set()
+    for a, b, c, d in zip(s, s[1:], s[2:], s[3:]):
+        if a != b and a == d and b == c:
+            return True
+    return False
+
+
+def supports_tls(address: Address) -> bool:
+    supernets, hypernets = address
+    if any(has_abba(hypernet) for hypernet in hypernets):
+        return False
+    return any(has_abba(word) for word in supernets)
+
+
+def part1(input: Iterable[Address]) -> int:
+    return sum(supports_tls(address) for address in input)
 
 
 def find_aba(s: str, reverse: bool = False) -> set[tuple[str, str]]:
@@ -51,10 +70,8 @@ def find_aba(s: str, reverse: bool = False) -> set[tuple[str, str]]:
     return abas
 
 
-def supports_ssl(s: str) -> bool:
-    words = s.replace("[", "]").split("]")
-    supernets = words[::2]
-    hypernets = words[1::2]
+def supports_ssl(address: Address) -> bool:
+    supernets, hypernets = address
     abas = set()
     babs = set()
     for supernet in supernets:
@@ -64,8 +81,8 @@ def supports_ssl(s: str) -> bool:
     return bool(abas.intersection(babs))
 
 
-def part2(input: list[str]) -> int:
-    return sum(supports_ssl(s) for s in input)
+def part2(input: Iterable[Address]) -> int:
+    return sum(supports_ssl(address) for address in input)
 
 
 def main() -> None:
@@ -7,6 +7,8 @@
 # 1 # E  G. G. GM GM GM #
 #########################
 
+INPUT = (8, 2, 0, 0)
+
 
 # Part 1
 
@@ -46,14 +48,13 @@ def part2(input: tuple[int, int, int, int]) -> int:
 
 
 def main() -> None:
-    items_in_floor = (8, 2, 0, 0)
     print("Part 1: ")
     print("-------")
-    print(part1(items_in_floor))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(items_in_floor))
+    print(part2(INPUT))
     print("=======\n")
 
 
@@ -1,51 +1,36 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.vm import ASSEMBUNNY, Machine  # noqa: E402
+
+
 def read_input(input_file) -> list[str]:
     with open(input_file, "r") as f:
         return f.read().splitlines()
 
 
-class Computer:
-    def __init__(self) -> None:
-        self.registers = dict.fromkeys("abcd", 0)
-
-    def value(self, name: str) -> int:
-        if name in "abcd":
-            return self.registers[name]
-        else:
-            return int(name)
-
-    def eval(self, instruction: str) -> int:
-        match instruction.split():
-            case ["cpy", origin, target]:
-                self.registers[target] = self.value(origin)
-            case ["inc", register]:
-                self.registers[register] += 1
-            case ["dec", register]:
-                self.registers[register] -= 1
-            case ["jnz", origin, offset]:
-                if self.value(origin):
-                    return self.value(offset)
-            case _:
-                raise ValueError(f"Invalid instruction {instruction}")
-        return 1
+class Computer(Machine):
+    def __init__(self, program: list[str]) -> None:
+        super().__init__(program, ASSEMBUNNY)
 
-    def run_program(self, program: list[str]) -> int:
-        i = 0
-        while i < len(program):
-            i += self.eval(program[i])
-        return self.registers
+    def run_program(self) -> dict[str, int]:
+        self.run()
+        return {r: self[r] for r in "abcd"}
 
 
 def part1(input: list[str]) -> int:
-    computer = Computer()
-    computer.run_program(input)
-    return computer.registers["a"]
+    computer = Computer(input)
+    computer.run_program()
+    return computer["a"]
 
 
 def part2(input: list[str]) -> int:
-    computer = Computer()
-    computer.registers["c"] = 1
-    computer.run_program(input)
-    return computer.registers["a"]
+    computer = Computer(input)
+    computer["c"] = 1
+    computer.run_program()
+    return computer["a"]
 
 
 def main() -> None:
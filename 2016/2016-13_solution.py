@@ -1,58 +1,63 @@
-def is_wall(x: int, y: int, input_value: int = 1358) -> bool:
-    if x < 0 or y < 0:
-        return True
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import bfs  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
+INPUT = 1358
+START = (1, 1)
+TARGET = (31, 39)
+
+
+def open_spaces(size: int, input_value: int = INPUT) -> np.ndarray:
+    # the office for 0 <= x, y < size, indexed [x, y]: a wall where
+    # x*x + 3*x + 2*x*y + y + y*y + input_value has an odd number of 1 bits
+    x, y = np.indices((size, size), dtype=np.int64)
     n = x * x + 3 * x + 2 * x * y + y + y * y + input_value
-    binary_digits = bin(n)[2:]
-    return bool(binary_digits.count("1") % 2)
-
-
-def part1(input_value: int, target: tuple[int, int]) -> int:
-    n_steps = 0
-    visited = {(1, 1)}
-    step_positions = {(1, 1)}
-
-    while step_positions:
-        next_positions = set()
-        for x, y in step_positions:
-            if (x, y) == target:
-                return n_steps
-            for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-                new_position = (x + dx, y + dy)
-                if new_position not in visited and not is_wall(*new_position):
-                    visited.add(new_position)
-                    next_positions.add(new_position)
-        step_positions = next_positions
-        n_steps += 1
-    raise RuntimeError("No path found")
-
-
-def part2(input_value: int, target: tuple[int, int]) -> int:
-    visited = {(1, 1)}
-    step_positions = {(1, 1)}
-
-    for _ in range(50):
-        next_positions = set()
-        for x, y in step_positions:
-            for dx, dy in ((0, 1), (0, -1), (1, 0), (-1, 0)):
-                new_position = (x + dx, y + dy)
-                if new_position not in visited and not is_wall(*new_position):
-                    visited.add(new_position)
-                    next_positions.add(new_position)
-        step_positions = next_positions
-
-    return len(visited)
+    for shift in (32, 16, 8, 4, 2, 1):
+        n ^= n >> shift
+    return n & 1 == 0
+
+
+def part1(input_value: int, target: tuple[int, int] = TARGET) -> int:
+    # a path leaving the office square of side size takes at least
+    # 2 * size - 1 - max(target) steps, so shorter distances are final;
+    # otherwise the square is doubled
+    size = 2 * max(target) + 2
+    while True:
+        office = open_spaces(size, input_value)
+        distances = bfs(office, START)
+        d = int(distances[target])
+        if 0 <= d < 2 * size - 1 - max(target):
+            return d
+        # the reachable area is enclosed if it doesn't touch the far edges
+        enclosed = (distances[-1] < 0).all() and (distances[:, -1] < 0).all()
+        if not office[target] or enclosed:
+            raise RuntimeError("No path found")
+        size *= 2
+
+
+def part2(input_value: int, steps: int = 50) -> int:
+    # cells within `steps` of the start lie within the square
+    size = max(START) + steps + 1
+    distances = bfs(open_spaces(size, input_value), START)
+    return int(((distances >= 0) & (distances <= steps)).sum())
 
 
 def main() -> None:
-    input_value = 1358
-    target = (31, 39)
     print("Part 1: ")
     print("-------")
-    print(part1(input_value, target))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(input_value, target))
+    print(part2(INPUT))
     print("=======\n")
 
 
@@ -1,24 +1,46 @@
-import hashlib
-from collections import defaultdict
-
-import tqdm
-
-
-class DefaultDictKey(defaultdict):
-    def __missing__(self, key):
-        self[key] = self.default_factory(key)
-        return self[key]
-
-
-class HashDict(DefaultDictKey):
-    def __init__(self, salt: str, n_repeats: int) -> None:
-        def default_factory(n: int) -> str:
-            s = salt + str(n)
-            for _ in range(n_repeats):
-                s = hashlib.md5(s.encode()).hexdigest()
-            return s
-
-        super().__init__(default_factory)
+import re
+import sys
+from collections import defaultdict, deque
+from collections.abc import Iterator
+from contextlib import closing
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.md5 import stretched  # noqa: E402
+
+INPUT = "qzyelonm"
+QUINTUPLET = re.compile(r"(.)\1{4}")
+
+
+class HashWindow:
+    # Goes through the hashes of the indices in order, keeping only the next
+    # `size` ones, which are computed ahead in parallel batches. Their
+    # quintuplets are indexed by character, in index order.
+    def __init__(self, salt: str, n_repeats: int, size: int = 1000) -> None:
+        self.salt = salt
+        self.n_repeats = n_repeats
+        self.size = size
+        self.ahead: deque[tuple[str, list[str]]] = deque()
+        self.quintuplets: defaultdict[str, deque[int]] = defaultdict(deque)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        with closing(stretched(self.salt, self.n_repeats)) as hashes:
+            for i, hash in enumerate(hashes):
+                characters = QUINTUPLET.findall(hash)
+                for c in characters:
+                    self.quintuplets[c].append(i)
+                self.ahead.append((hash, characters))
+                if i >= self.size:
+                    # i - size, with the next size hashes in the window
+                    hash, characters = self.ahead.popleft()
+                    for c in characters:
+                        self.quintuplets[c].popleft()
+                    yield i - self.size, hash
+
+    def has_quintuplet(self, c: str) -> bool:
+        # of c in the next size hashes
+        return bool(self.quintuplets[c])
 
 
 def find_triplet(hash: str) -> str:
@@ -31,17 +53,12 @@ def find_triplet(hash: str) -> str:
 def part1(salt: str, n_repeats: int = 1) -> int:
     n_keys = 64
     keys = []
-    hashes = HashDict(salt, n_repeats)
-    i = 0
-
-    pbar = tqdm.tqdm(total=n_keys)
-    while len(keys) < n_keys:
-        if c := find_triplet(hashes[i]):
-            if any(c * 5 in hashes[i + j + 1] for j in range(1000)):
-                keys.append(i)
-                pbar.update()
-        i += 1
-    return keys[-1]
+    window = HashWindow(salt, n_repeats)
+    for i, hash in window:
+        if (c := find_triplet(hash)) and window.has_quintuplet(c):
+            keys.append(i)
+            if len(keys) == n_keys:
+                return i
 
 
 def part2(salt: str) -> int:
@@ -49,14 +66,13 @@ def part2(salt: str) -> int:
 
 
 def main() -> None:
-    input_value = "qzyelonm"
     print("Part 1: ")
     print("-------")
-    print(part1(input_value))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(input_value))
+    print(part2(INPUT))
     print("=======\n")
 
 
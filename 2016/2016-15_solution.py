@@ -1,8 +1,14 @@
-import math
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
-# find the solution in t to
-#  t % k == (initial + delta_t) % k
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.congruence import Congruence, crt  # noqa: E402
+
+# disc j (from 1) is open when the capsule reaches it if
+#  (initial + t + j) % k == 0, i.e. t % k == -(initial + j) % k,
+# and the smallest t solving all of these comes from the CRT
 
 
 @dataclass(frozen=True)
@@ -10,8 +16,9 @@ class Disc:
     k: int  # number of positions
     i: int  # initial position
 
-    def is_open(self, time: int) -> bool:
-        return (self.i + time) % self.k == 0
+    def congruence(self, delay: int) -> Congruence:
+        # times t at which a capsule released at t reaches the disc while open
+        return -(self.i + delay), self.k
 
 
 def read_input(input_file) -> list[Disc]:
@@ -23,35 +30,15 @@ def read_input(input_file) -> list[Disc]:
     return discs
 
 
-def product(numbers: list[int]) -> int:
-    p = 1
-    for n in numbers:
-        p *= n
-    return p
-
-
-def part1(discs: tuple[tuple[int, int], ...]) -> int:
-    divisors = [disc.k for disc in discs]
-    period = math.lcm(*divisors)
-    # TODO: make faster using Chinese Remainder Theorem
-    # # check that divisors are coprime
-    # assert period == product(divisors)
-
-    for t in range(period):
-        if all(disc.is_open(t + i + 1) for i, disc in enumerate(discs)):
-            return t
+def part1(discs: list[Disc]) -> int:
+    solution = crt(disc.congruence(i + 1) for i, disc in enumerate(discs))
+    if solution is None:
+        raise RuntimeError("No solution found")
+    return solution[0]
 
 
-def part2(discs: tuple[tuple[int, int], ...]) -> int:
-    new_disc = Disc(11, 0)
-    # return part1(discs + [new_disc])
-    part1_solution = part1(discs)
-    period = math.lcm(*[disc.k for disc in discs])
-    for i in range(1, 12):
-        t = part1_solution + i * period
-        if new_disc.is_open(t + len(discs) + 1):
-            return t
-    raise RuntimeError("No solution found")
+def part2(discs: list[Disc]) -> int:
+    return part1(discs + [Disc(11, 0)])
 
 
 def main() -> None:
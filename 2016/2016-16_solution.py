@@ -1,5 +1,7 @@
 import numpy as np
 
+INPUT = "10111100110001111"
+
 
 def iterate(data: np.ndarray) -> np.ndarray:
     return np.concatenate((data, [0], np.flip(1 - data)))
@@ -24,14 +26,13 @@ def part2(initial_data: str) -> str:
 
 
 def main() -> None:
-    initial_data = "10111100110001111"
     print("Part 1: ")
     print("-------")
-    print(part1(initial_data))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(initial_data))
+    print(part2(INPUT))
     print("=======\n")
 
 
@@ -1,6 +1,8 @@
 import hashlib
 from collections import Counter
 
+INPUT = "rrrbmfta"
+
 
 def md5_string(s: str) -> str:
     return hashlib.md5(s.encode()).hexdigest()
@@ -56,14 +58,13 @@ def part2(passcode: str) -> str:
 
 
 def main() -> None:
-    puzzle_input = "rrrbmfta"
     print("Part 1: ")
     print("-------")
-    print(part1(puzzle_input))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(puzzle_input))
+    print(part2(INPUT))
     print("=======\n")
 
 
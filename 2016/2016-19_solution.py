@@ -1,5 +1,7 @@
 import math
 
+INPUT = 3012210
+
 
 def highest_power(n: int, base: int = 2) -> int:
     """Return the highest power of base <= n."""
@@ -22,14 +24,13 @@ def part2(puzzle_input: int) -> int:
 
 
 def main() -> None:
-    puzzle_input = 3012210
     print("Part 1: ")
     print("-------")
-    print(part1(puzzle_input))
+    print(part1(INPUT))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(puzzle_input))
+    print(part2(INPUT))
     print("=======\n")
 
 
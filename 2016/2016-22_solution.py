@@ -1,5 +1,16 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass
 from itertools import product
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.loader import cached_parse, read_lines  # noqa: E402
+
+plt = lazy_import("matplotlib.pyplot")
 
 
 @dataclass
@@ -42,11 +53,12 @@ class Node:
         return node
 
 
+@cached_parse
 def read_input(input_file) -> list[Node]:
-    with open(input_file, "r") as f:
-        assert f.readline().strip().endswith("df -h")
-        assert f.readline().strip().startswith("Filesystem")
-        return [Node.from_string(line.rstrip()) for line in f]
+    command, header, *lines = read_lines(input_file)
+    assert command.strip().endswith("df -h")
+    assert header.strip().startswith("Filesystem")
+    return [Node.from_string(line.rstrip()) for line in lines]
 
 
 def part1(puzzle_input: list[Node]) -> int:
@@ -57,9 +69,6 @@ def part1(puzzle_input: list[Node]) -> int:
     )
 
 
-import matplotlib.pyplot as plt
-
-
 class Grid:
     def __init__(self, nodes: list[Node]) -> None:
         self.max_x = max(node.x for node in nodes)
@@ -115,10 +124,11 @@ class Grid:
         self.grid[y1][x1].used = 0
 
 
-def part2(puzzle_input: list[Node]) -> ...:
+def part2(puzzle_input: list[Node], plot: bool = False) -> ...:
     grid = Grid(puzzle_input)
     empty_y, empty_x = grid.max_avail()
-    grid.plot()
+    if plot:
+        grid.plot()
     assert empty_y < grid.max_y
     moves = 0
     # if all moves were possible, the optimal solution would be:
@@ -0,0 +1,43 @@
+import random
+
+
+SIZES = (3, 4, 5, 6, 7, 8, 9)
+HEIGHT = 41
+WIDTH = 181
+# fraction of inner walls knocked down, so that there are many paths
+OPENINGS = 0.1
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # a maze on the odd cells, carved by a random depth first search, with
+    # points of interest 0 to size - 1 (at most 10) on distinct cells
+    assert 1 <= size <= 10
+    rng = random.Random(seed)
+    grid = [["#"] * WIDTH for _ in range(HEIGHT)]
+    cells = [(i, j) for i in range(1, HEIGHT, 2) for j in range(1, WIDTH, 2)]
+    start = rng.choice(cells)
+    grid[start[0]][start[1]] = "."
+    stack = [start]
+    while stack:
+        i, j = stack[-1]
+        unvisited = [
+            (i + di, j + dj)
+            for di, dj in ((-2, 0), (2, 0), (0, -2), (0, 2))
+            if 0 < i + di < HEIGHT
+            and 0 < j + dj < WIDTH
+            and grid[i + di][j + dj] == "#"
+        ]
+        if not unvisited:
+            stack.pop()
+            continue
+        ni, nj = rng.choice(unvisited)
+        grid[(i + ni) // 2][(j + nj) // 2] = "."
+        grid[ni][nj] = "."
+        stack.append((ni, nj))
+    for i in range(1, HEIGHT - 1):
+        for j in range(1, WIDTH - 1):
+            if (i + j) % 2 and rng.random() < OPENINGS:
+                grid[i][j] = "."
+    for n, (i, j) in enumerate(rng.sample(cells, size)):
+        grid[i][j] = str(n)
+    return "".join("".join(row) + "\n" for row in grid)
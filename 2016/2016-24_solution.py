@@ -1,7 +1,15 @@
-from itertools import permutations
+from __future__ import annotations
 
-import matplotlib.pyplot as plt
-import networkx as nx
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
+from aoc.tsp import held_karp  # noqa: E402
+
+plt = lazy_import("matplotlib.pyplot")
+nx = lazy_import("networkx")
 
 
 def read_input(input_file) -> list[str]:
@@ -55,16 +63,10 @@ class Maze:
         return sum(self.distances[i][j] for i, j in zip(path, path[1:]))
 
     def find_shortest_path(self) -> int:
-        return min(
-            self.path_length((0,) + p)
-            for p in permutations(range(1, len(self.locations)))
-        )
+        return held_karp(self.distances, start=0)
 
     def find_shortest_cycle(self) -> int:
-        return min(
-            self.path_length((0,) + p + (0,))
-            for p in permutations(range(1, len(self.locations)))
-        )
+        return held_karp(self.distances, start=0, cycle=True)
 
 
 def part1(puzzle_input: list[str]) -> int:
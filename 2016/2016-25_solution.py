@@ -1,4 +1,10 @@
-import tqdm
+import sys
+from itertools import count
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.vm import ASSEMBUNNY, Machine, Status  # noqa: E402
 
 
 def read_input(input_file) -> list[str]:
@@ -6,29 +12,25 @@ def read_input(input_file) -> list[str]:
         return f.read().splitlines()
 
 
-def run_program(a: int) -> ...:
-    # HARDCODED / COMPILED PROGRAM:
-    # lines 0, 1 are assignments
-    # 2-7 is a loop implementing multiplication
-    d = a + 182 * 14  # = a + 2548
-    # the rest of the program is an infinite loop
-    # that can be simplified to:
-    while True:
-        a = d
-        while a:
-            b = a
-            a = b // 2
-            print(1 - b % 2)
-    # it prints the binary representation of d
-    # repeatedly
+def is_clock_signal(program: list[str], a: int) -> bool:
+    # the output must be 0, 1, 0, 1, ... forever: it is once the machine
+    # comes back to a state it was in when it had to output the same value
+    machine = Machine(program, ASSEMBUNNY, a=a)
+    seen = set()
+    expected = 0
+    while machine.run() is Status.OUTPUT:
+        if machine.outbox.pop() != expected:
+            return False
+        expected = 1 - expected
+        state = (machine.pc, tuple(machine.registers), expected)
+        if state in seen:
+            return True
+        seen.add(state)
+    return False
 
 
-def part1(offset: int) -> int:
-    # solve min_a | a + offset = k,
-    # where k has binary representation alternating ones
-    # and zeros, with the same number of digits as offset
-    k = sum(2**i for i in range(offset.bit_length()) if i % 2 == 1)
-    return k - offset
+def part1(puzzle_input: list[str]) -> int:
+    return next(a for a in count(1) if is_clock_signal(puzzle_input, a))
 
 
 def part2(puzzle_input) -> ...:
@@ -36,15 +38,14 @@ def part2(puzzle_input) -> ...:
 
 
 def main() -> None:
-    # puzzle_input = read_input("2016-25_input.txt")
-    offset = 182 * 14
+    puzzle_input = read_input("2016-25_input.txt")
     print("Part 1: ")
     print("-------")
-    print(part1(offset))
+    print(part1(puzzle_input))
     print("=======\n")
     print("Part 2: ")
     print("-------")
-    print(part2(offset))
+    print(part2(puzzle_input))
     print("=======\n")
 
 
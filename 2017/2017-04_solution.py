@@ -1,9 +1,16 @@
+import sys
 from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> list[str]:
-    with open(input_file, "r") as f:
-        return f.read().splitlines()
+from aoc.loader import iter_lines  # noqa: E402
+
+
+def read_input(input_file, stream: bool = False) -> Iterable[str]:
+    lines = iter_lines(input_file)
+    return lines if stream else list(lines)
 
 
 def is_valid(passphrase: str) -> bool:
@@ -11,7 +18,7 @@ def is_valid(passphrase: str) -> bool:
     return len(words) == len(set(words))
 
 
-def part1(puzzle_input: list[str]) -> int:
+def part1(puzzle_input: Iterable[str]) -> int:
     return sum(is_valid(passphrase) for passphrase in puzzle_input)
 
 
@@ -22,7 +29,7 @@ def is_valid2(passphrase: str) -> bool:
     )
 
 
-def part2(puzzle_input: list[str]) -> int:
+def part2(puzzle_input: Iterable[str]) -> int:
     return sum(is_valid2(passphrase) for passphrase in puzzle_input)
 
 
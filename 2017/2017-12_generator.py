@@ -0,0 +1,22 @@
+import random
+
+
+SIZES = (1000, 2000, 4000, 8000, 16000)
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # size programs, each piped to a few others; pipes go both ways and some
+    # programs only talk to themselves, as in the real input
+    rng = random.Random(seed)
+    links = [set() for _ in range(size)]
+    for a in range(size):
+        for b in rng.sample(range(size), rng.randint(0, 2)):
+            links[a].add(b)
+            links[b].add(a)
+    for a, linked in enumerate(links):
+        if not linked:
+            linked.add(a)
+    return "".join(
+        f"{a} <-> {', '.join(map(str, sorted(linked)))}\n"
+        for a, linked in enumerate(links)
+    )
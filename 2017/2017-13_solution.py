@@ -1,3 +1,11 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.congruence import sieve  # noqa: E402
+
+
 def read_input(input_file) -> list[tuple[int, int]]:
     with open(input_file, "r") as f:
         return [
@@ -6,8 +14,13 @@ def read_input(input_file) -> list[tuple[int, int]]:
         ]
 
 
+def period(range):
+    # a scanner with a range of 1 never moves, and catches at every time
+    return max(2 * (range - 1), 1)
+
+
 def is_caught(depth, range):
-    return depth % (2 * (range - 1)) == 0
+    return depth % period(range) == 0
 
 
 def severity(depth, range):
@@ -23,11 +36,11 @@ def part1(puzzle_input: list[tuple[int, int]]) -> int:
 
 
 def part2(puzzle_input: list[tuple[int, int]]) -> int:
-    delay = 0
-    while any(
-        is_caught(depth + delay, range) for depth, range in puzzle_input
-    ):
-        delay += 1
+    # caught at depth when (depth + delay) % period(range) == 0
+    delays = sieve((-depth, period(range)) for depth, range in puzzle_input)
+    delay = next(delays, None)
+    if delay is None:
+        raise RuntimeError("No solution found")
     return delay
 
 
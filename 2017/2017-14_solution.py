@@ -1,7 +1,11 @@
-import operator
+import sys
 from collections import defaultdict
-from functools import reduce
-from itertools import product
+from functools import cache
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.knot import knot_hashes  # noqa: E402
 
 
 def read_input(input_file) -> str:
@@ -9,52 +13,18 @@ def read_input(input_file) -> str:
         return f.read().strip()
 
 
-class Knot:
-    def __init__(self, size: int) -> None:
-        self.n = size
-        self.knot = list(range(size))
-
-    def reverse(self, start: int, length: int) -> None:
-        if length >= self.n:
-            # NOTE: length == self.n could be valid but is not used in this puzzle
-            raise ValueError("Length cannot be greater than size of knot")
-        start %= self.n
-        if (stop := start + length) > self.n:
-            stop %= self.n
-        if start < stop:
-            end = start - 1 if start > 0 else None
-            self.knot[start:stop] = self.knot[stop - 1 : end : -1]
-        elif start > stop:
-            reversed = (self.knot[start:] + self.knot[:stop])[::-1]
-            self.knot[start:] = reversed[: self.n - start]
-            self.knot[:stop] = reversed[self.n - start :]
-
-    def __repr__(self) -> str:
-        return f"Knot({self.knot})"
-
-    def dense_hash(self) -> list[int]:
-        hash_ints = [
-            reduce(operator.xor, self.knot[16 * i : 16 * (i + 1)])
-            for i in range(self.n // 16)
-        ]
-        hash_str = "".join(f"{n:08b}" for n in hash_ints)
-        return hash_str
-
-
-def knot_hash(string: str) -> str:
-    knot = Knot(256)
-    s, i = 0, 0
-    lengths = [ord(c) for c in string] + [17, 31, 73, 47, 23]
-    for _ in range(64):
-        for length in lengths:
-            knot.reverse(i, length)
-            i = i + length + s
-            s = s + 1
-    return knot.dense_hash()
+@cache
+def disk(key: str) -> tuple[tuple[bool, ...], ...]:
+    # the used squares, shared by both parts
+    rows = knot_hashes(f"{key}-{i}" for i in range(128))
+    return tuple(
+        tuple(c == "1" for c in "".join(f"{n:08b}" for n in row))
+        for row in rows
+    )
 
 
 def part1(puzzle_input: str) -> int:
-    return sum(knot_hash(f"{puzzle_input}-{i}").count("1") for i in range(128))
+    return sum(map(sum, disk(puzzle_input)))
 
 
 class Graph:
@@ -76,10 +46,7 @@ class Graph:
 
 
 def part2(puzzle_input: str) -> int:
-    used_grid = [
-        [c == "1" for c in knot_hash(f"{puzzle_input}-{i}")]
-        for i in range(128)
-    ]
+    used_grid = disk(puzzle_input)
     g = Graph()
 
     not_visited = set()
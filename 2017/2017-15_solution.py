@@ -1,60 +1,30 @@
-from collections.abc import Iterator
+from __future__ import annotations
 
-import tqdm
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> dict[str, int]:
-    with open(input_file, "r") as f:
-        return {line.split()[1]: int(line.split()[-1]) for line in f}
-
+from aoc.lcg import filtered, matches  # noqa: E402
 
-def modular_geometric_generator(
-    start: int, base: int, modulus: int, multiple_only: int | None = None
-) -> Iterator[int]:
-    while True:
-        start = (start * base) % modulus
-        if multiple_only is None or start % multiple_only == 0:
-            yield start
+FACTORS = {"A": 16807, "B": 48271}  # 7 ** 5, prime
 
 
-def part1(puzzle_input: dict[str, int]) -> int:
-    a = puzzle_input["A"]
-    b = puzzle_input["B"]
-    c = 2147483647  # 2**31 - 1 (prime)
-    a_base = 16807  # 7 ** 5
-    b_base = 48271  # prime
-
-    # TODO: can we do something smart with modular arithmetic?
-    # we are counting the solutions to
-    # (a_base ** n * a) == (b_base ** n * b) (mod c) (mod 2**16)
+def read_input(input_file) -> dict[str, int]:
+    with open(input_file, "r") as f:
+        return {line.split()[1]: int(line.split()[-1]) for line in f}
 
-    a_gen = modular_geometric_generator(a, a_base, c)
-    b_gen = modular_geometric_generator(b, b_base, c)
-    count = 0
-    for _ in tqdm.trange(40_000_000):
-        a = next(a_gen)
-        b = next(b_gen)
-        if a % 65536 == b % 65536:
-            count += 1
-    return count
 
+def part1(puzzle_input: dict[str, int], n: int = 40_000_000) -> int:
+    a = puzzle_input["A"], FACTORS["A"]
+    b = puzzle_input["B"], FACTORS["B"]
+    return matches(a, b, n)
 
-def part2(puzzle_input: dict[str, int]) -> int:
-    a = puzzle_input["A"]
-    b = puzzle_input["B"]
-    c = 2147483647  # 2**31 - 1 (prime)
-    a_base = 16807  # 7 ** 5
-    b_base = 48271  # prime
 
-    a_gen = modular_geometric_generator(a, a_base, c, 4)
-    b_gen = modular_geometric_generator(b, b_base, c, 8)
-    count = 0
-    for _ in tqdm.trange(5_000_000):
-        a = next(a_gen)
-        b = next(b_gen)
-        if a % 65536 == b % 65536:
-            count += 1
-    return count
+def part2(puzzle_input: dict[str, int], n: int = 5_000_000) -> int:
+    a = filtered(puzzle_input["A"], FACTORS["A"], 4, n)
+    b = filtered(puzzle_input["B"], FACTORS["B"], 8, n)
+    return int((a == b).sum())
 
 
 def main() -> None:
@@ -1,55 +1,102 @@
-def read_input(input_file) -> list[str]:
-    with open(input_file, "r") as f:
-        return f.read().strip().split(",")
-
-
-class DancingGroup:
-    def __init__(self, s: str) -> None:
-        self.p = list(s)
-
-    def step(self, move: str) -> None:
-        match move[0]:
-            case "s":
-                n = int(move[1:])
-                self.p = self.p[-n:] + self.p[:-n]
-            case "x":
-                a, b = map(int, move[1:].split("/"))
-                self.p[a], self.p[b] = self.p[b], self.p[a]
-            case "p":
-                a, b = move[1:].split("/")
-                a, b = self.p.index(a), self.p.index(b)
-                self.p[a], self.p[b] = self.p[b], self.p[a]
-            case _:
-                raise ValueError(f"Invalid move: {move}")
-
-    def dance(self, moves: list[str]) -> None:
-        for move in moves:
-            self.step(move)
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.loader import cached_parse, read_text  # noqa: E402
+
+PROGRAMS = "abcdefghijklmnop"
 
-    def __repr__(self) -> str:
-        return "".join(self.p)
+# ("s", n, 0), ("x", i, j) or ("p", a, b)
+Move = tuple[str, int | str, int | str]
+# the i-th element is the index mapped to i
+Permutation = tuple[int, ...]
 
 
-def part1(puzzle_input: list[str]) -> str:
-    programs = DancingGroup("abcdefghijklmnop")
-    programs.dance(puzzle_input)
-    return programs
+def parse_move(move: str) -> Move:
+    match move[0]:
+        case "s":
+            return "s", int(move[1:]), 0
+        case "x":
+            a, b = map(int, move[1:].split("/"))
+            return "x", a, b
+        case "p":
+            a, b = move[1:].split("/")
+            return "p", a, b
+        case _:
+            raise ValueError(f"Invalid move: {move}")
 
 
-def part2(puzzle_input: list[str]) -> str:
-    programs = DancingGroup("abcdefghijklmnop")
+def compose(p: Permutation, q: Permutation) -> Permutation:
+    # p, then q
+    return tuple(p[i] for i in q)
 
-    # Find period
-    for i in range(10**9):
-        programs.dance(puzzle_input)
-        if str(programs) == "abcdefghijklmnop":
-            break
-    period = i + 1
 
-    for _ in range(10**9 % period):
-        programs.dance(puzzle_input)
+@cached_parse
+def read_input(input_file) -> list[Move]:
+    return [parse_move(move) for move in read_text(input_file).split(",")]
 
-    return programs
+
+class Dance:
+    # A dance is a permutation of the positions (s and x moves) and one of
+    # the names (p moves), which don't interact: positions[i] is where the
+    # program ending at position i started, names[k] the index of the name
+    # the k-th name ends up as.
+    def __init__(self, positions: Permutation, names: Permutation) -> None:
+        self.positions = positions
+        self.names = names
+
+    @classmethod
+    def compile(cls, moves: list[Move], n: int = 16) -> "Dance":
+        positions = list(range(n))
+        names = list(range(n))
+        for move in moves:
+            match move:
+                case "s", k, _:
+                    positions = positions[-k:] + positions[:-k]
+                case "x", a, b:
+                    positions[a], positions[b] = positions[b], positions[a]
+                case "p", a, b:
+                    a, b = names.index(ord(a) - ord("a")), names.index(
+                        ord(b) - ord("a")
+                    )
+                    names[a], names[b] = names[b], names[a]
+                case _:
+                    raise ValueError(f"Invalid move: {move}")
+        return cls(tuple(positions), tuple(names))
+
+    def __mul__(self, other: "Dance") -> "Dance":
+        # self, then other
+        return Dance(
+            compose(self.positions, other.positions),
+            compose(other.names, self.names),
+        )
+
+    def __pow__(self, k: int) -> "Dance":
+        # by squaring, in O(log k) compositions
+        n = len(self.positions)
+        result = Dance(tuple(range(n)), tuple(range(n)))
+        square = self
+        while k:
+            if k & 1:
+                result = result * square
+            square = square * square
+            k >>= 1
+        return result
+
+    def __call__(self, programs: str) -> str:
+        return "".join(
+            chr(ord("a") + self.names[ord(programs[i]) - ord("a")])
+            for i in self.positions
+        )
+
+
+def part1(puzzle_input: list[Move]) -> str:
+    return Dance.compile(puzzle_input)(PROGRAMS)
+
+
+def part2(puzzle_input: list[Move], n_dances: int = 10**9) -> str:
+    return (Dance.compile(puzzle_input) ** n_dances)(PROGRAMS)
 
 
 def main() -> None:
@@ -3,28 +3,61 @@ def read_input(filename: str) -> int:
         return int(f.read())
 
 
-def part1(puzzle_input: int) -> int:
-    buffer = [0]
+def insert_positions(step: int, n: int) -> list[int]:
+    # index at which each of the values 1 to n is inserted, in the buffer
+    # right after its insertion (so value m is at index positions[m])
+    positions = [0]
     i = 0
-    for n in range(2017):
-        i = (i + puzzle_input) % (n + 1) + 1
-        buffer.insert(i, n + 1)
-    return buffer[i + 1]
+    for m in range(1, n + 1):
+        i = (i + step) % m + 1
+        positions.append(i)
+    return positions
 
 
-import tqdm
+def value_at(positions: list[int], index: int) -> int:
+    # value at index in the buffer after the insertions, without building
+    # it: going back through the insertions, the index moves down by one for
+    # each value inserted before it, until it is where a value was inserted
+    n = len(positions) - 1
+    index %= n + 1
+    for m in range(n, 0, -1):
+        if index == positions[m]:
+            return m
+        if index > positions[m]:
+            index -= 1
+    return 0
 
 
-def part2(puzzle_input: int) -> int:
-    i = 0
-    v = 0  # value at index 1 (after 0)
-    for n in (pbar := tqdm.trange(50_000_000)):
-        # current buffer length is n + 1
-        i = (i + puzzle_input) % (n + 1) + 1
+def value_after_zero(step: int, n: int) -> int:
+    # 0 stays at index 0, so the value after it is the last one inserted at
+    # index 1. Insertions that don't wrap around the buffer just move the
+    # position forward by step + 1 and can't land there: they are skipped
+    # in one go, only the wrapping ones are simulated.
+    if step == 0:
+        # each value goes right after the previous one
+        return min(n, 1)
+    i, m, value = 0, 0, 0
+    while m < n:
+        # m values inserted so far, the buffer holds m + 1
+        if (room := m - i - step) >= 0:
+            skip = min(room // step + 1, n - m)
+            i += skip * (step + 1)
+            m += skip
+            continue
+        i = (i + step) % (m + 1) + 1
+        m += 1
         if i == 1:
-            v = n + 1
-            pbar.set_description(f"[0 {v} ...]")
-    return v
+            value = m
+    return value
+
+
+def part1(puzzle_input: int) -> int:
+    positions = insert_positions(puzzle_input, 2017)
+    return value_at(positions, positions[-1] + 1)
+
+
+def part2(puzzle_input: int) -> int:
+    return value_after_zero(puzzle_input, 50_000_000)
 
 
 def main() -> None:
@@ -1,5 +1,10 @@
-from collections import defaultdict
-from dataclasses import dataclass
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.vm import DUET, Machine, Scheduler, Status  # noqa: E402
 
 
 def read_input(input_file) -> list[str]:
@@ -7,67 +12,38 @@ def read_input(input_file) -> list[str]:
         return f.read().splitlines()
 
 
-class Registers(dict):
-    def __missing__(self, key):
-        match key:
-            case str() if len(key) == 1 and key.isalpha():
-                self[key] = 0
-                return self[key]
-            case _:
-                try:
-                    return int(key)
-                except ValueError:
-                    raise KeyError(f"Invalid register: {key}")
-
-
-@dataclass(frozen=True)
-class Sound(Exception):
-    frequency: int
-
-
-class Synth:
-    def __init__(self) -> None:
-        self.registers = Registers()
-
-    def run_instruction(self, instruction: str) -> int:
-        match instruction.split():
-            case ["snd", x]:
-                self.registers["sound"] = self.registers[x]
-            case ["set", x, y]:
-                self.registers[x] = self.registers[y]
-            case ["add", x, y]:
-                self.registers[x] += self.registers[y]
-            case ["mul", x, y]:
-                self.registers[x] *= self.registers[y]
-            case ["mod", x, y]:
-                self.registers[x] %= self.registers[y]
-            case ["rcv", x]:
-                if self.registers[x] != 0:
-                    raise Sound(frequency=self.registers["sound"])
-            case ["jgz", x, y]:
-                if self.registers[x] > 0:
-                    return self.registers[y]
-            case _:
-                raise ValueError(f"Invalid instruction: {instruction}")
-        return 1
-
-    def run_until_sound(self, instructions: list[str]) -> int:
-        i = 0
-        while 0 <= i < len(instructions):
-            try:
-                i += self.run_instruction(instructions[i])
-            except Sound as e:
-                return e.frequency
+class Synth(Machine):
+    def __init__(self, instructions: list[str], **registers: int) -> None:
+        super().__init__(instructions, DUET, **registers)
+
+    def run_until_sound(self) -> int:
+        while self.run() is Status.RECEIVING:
+            # rcv X recovers the last sound played, unless X is 0
+            if self.argument() != 0:
+                if not self.outbox:
+                    raise ValueError("No sound played")
+                return self.outbox[-1]
+            self.pc += 1
         raise ValueError("No sound played")
 
 
 def part1(puzzle_input: list[str]) -> int:
-    s = Synth()
-    return s.run_until_sound(puzzle_input)
+    s = Synth(puzzle_input)
+    return s.run_until_sound()
+
+
+def duet(instructions: list[str], n: int = 2) -> Scheduler:
+    # program i starts with p = i and sends to program i + 1 (mod n)
+    return Scheduler([Synth(instructions, p=i) for i in range(n)])
 
 
-def part2(puzzle_input: list[str]) -> int:
-    ...
+def part2(puzzle_input: list[str], use_asyncio: bool = False) -> int:
+    scheduler = duet(puzzle_input)
+    if use_asyncio:
+        asyncio.run(scheduler.run_async())
+    else:
+        scheduler.run()
+    return scheduler.sent[1]
 
 
 def main() -> None:
@@ -1,6 +1,15 @@
-def read_input(input_file) -> list[str]:
-    with open(input_file, "r") as f:
-        return f.read().splitlines()
+import sys
+from collections.abc import Iterable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.loader import iter_lines  # noqa: E402
+
+
+def read_input(input_file, stream: bool = False) -> Iterable[str]:
+    lines = iter_lines(input_file)
+    return lines if stream else list(lines)
 
 
 def calibration_value(s: str) -> int:
@@ -8,7 +17,7 @@ def calibration_value(s: str) -> int:
     return int(f"{digits[0]}{digits[-1]}")
 
 
-def part1(puzzle_input: list[str]) -> int:
+def part1(puzzle_input: Iterable[str]) -> int:
     return sum(calibration_value(s) for s in puzzle_input)
 
 
@@ -39,7 +48,7 @@ def letters_to_digits(s: str) -> str:
     return digits_string
 
 
-def part2(puzzle_input: list[str]) -> int:
+def part2(puzzle_input: Iterable[str]) -> int:
     return sum(calibration_value(letters_to_digits(s)) for s in puzzle_input)
 
 
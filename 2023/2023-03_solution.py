@@ -1,5 +1,15 @@
+import re
+import sys
 from dataclasses import dataclass
 from functools import cached_property
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid, dilate  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
 
 
 def read_input(input_file) -> list[str]:
@@ -11,74 +21,55 @@ def read_input(input_file) -> list[str]:
 class Engine:
     schematic: list[str]
 
-    def neighbors(self, x, y):
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == dy == 0:
-                    continue
-                try:
-                    yield self.schematic[y + dy][x + dx]
-                except IndexError:
-                    continue
+    @cached_property
+    def grid(self) -> Grid:
+        return Grid.from_lines(self.schematic)
+
+    @cached_property
+    def near_symbol(self):
+        digits = (self.grid.cells >= ord("0")) & (self.grid.cells <= ord("9"))
+        symbols = ~digits & ~self.grid.mask(".")
+        return dilate(symbols, diagonal=True)
 
     def numbers(self):
         for y, row in enumerate(self.schematic):
-            i = 0
-            while i < len(row):
-                if row[i].isdigit():
-                    length = 1
-                    while i + length < len(row) and row[i + length].isdigit():
-                        length += 1
-                    # number, coordinates of first digit, length
-                    yield int(row[i : i + length]), (i, y), length
-                    i += length
-                else:
-                    i += 1
-
-    def number_neighbours(self, coords, length):
-        x, y = coords
-        for i in range(length):
-            yield from self.neighbors(x + i, y)
+            for match in re.finditer(r"\d+", row):
+                # number, coordinates of first digit, length
+                yield int(match[0]), (match.start(), y), len(match[0])
 
     def is_part(self, coords, length):
-        return any(
-            neighbor != "." and not neighbor.isdigit()
-            for neighbor in self.number_neighbours(coords, length)
-        )
+        x, y = coords
+        return bool(self.near_symbol[y, x : x + length].any())
 
-    def sum_part_numbers(self):
-        return sum(
-            number
+    @cached_property
+    def part_numbers(self):
+        return [
+            (number, coords, length)
             for number, coords, length in self.numbers()
             if self.is_part(coords, length)
-        )
+        ]
+
+    def sum_part_numbers(self):
+        return sum(number for number, _, _ in self.part_numbers)
 
     @cached_property
     def parts_map(self):
-        parts_map = {}
-        for number, coords, length in self.numbers():
-            if self.is_part(coords, length):
-                for i in range(length):
-                    parts_map[(coords[0] + i, coords[1])] = number
+        # index + 1 in part_numbers of the number on each cell, 0 if none
+        parts_map = np.zeros(self.grid.shape, dtype=np.int64)
+        for k, (_, (x, y), length) in enumerate(self.part_numbers, 1):
+            parts_map[y, x : x + length] = k
         return parts_map
 
     def neighbor_parts(self, x, y):
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == dy == 0:
-                    continue
-                try:
-                    yield self.parts_map[(x + dx, y + dy)]
-                except (IndexError, KeyError):
-                    continue
+        around = self.parts_map[max(y - 1, 0) : y + 2, max(x - 1, 0) : x + 2]
+        for i in np.unique(around[around > 0]):
+            yield self.part_numbers[i - 1][0]
 
     def gears(self):
-        for y, row in enumerate(self.schematic):
-            for x, char in enumerate(row):
-                if char == "*":
-                    neighbor_parts = set(self.neighbor_parts(x, y))
-                    if len(neighbor_parts) == 2:
-                        yield neighbor_parts.pop() * neighbor_parts.pop()
+        for y, x in np.argwhere(self.grid.cells == ord("*")):
+            neighbor_parts = list(self.neighbor_parts(x, y))
+            if len(neighbor_parts) == 2:
+                yield neighbor_parts[0] * neighbor_parts[1]
 
 
 def part1(puzzle_input: list[str]) -> int:
@@ -1,7 +1,16 @@
-import math
+import sys
+from dataclasses import dataclass
+from itertools import product
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> tuple[str, dict[str, dict[str, str]]]:
+from aoc.congruence import crt, lift  # noqa: E402
+
+Network = dict[str, dict[str, str]]
+
+
+def read_input(input_file) -> tuple[str, Network]:
     with open(input_file, "r") as f:
         lines = f.read().splitlines()
     assert lines[1] == ""
@@ -12,7 +21,7 @@ def read_input(input_file) -> tuple[str, dict[str, dict[str, str]]]:
     return lines[0], network_map
 
 
-def part1(puzzle_input: tuple[str, dict[str, dict[str, str]]]) -> int:
+def part1(puzzle_input: tuple[str, Network]) -> int:
     instructions, network_map = puzzle_input
     current = "AAA"
     c = 0
@@ -22,25 +31,61 @@ def part1(puzzle_input: tuple[str, dict[str, dict[str, str]]]) -> int:
     return c
 
 
-def part2(puzzle_input: tuple[str, dict[str, dict[str, str]]]) -> int:
+@dataclass(frozen=True)
+class Walk:
+    # the times at which a ghost is on a Z node: the hits before its state
+    # (node, instruction) starts repeating, then hits % period from start on
+    hits: tuple[int, ...]
+    start: int
+    period: int
+    residues: tuple[int, ...]
+
+    def __contains__(self, t: int) -> bool:
+        if t < self.start:
+            return t in self.hits
+        return t % self.period in self.residues
+
+
+def walk(current: str, instructions: str, network_map: Network) -> Walk:
+    seen: dict[tuple[str, int], int] = {}
+    hits = []
+    c = 0
+    while (state := (current, c % len(instructions))) not in seen:
+        seen[state] = c
+        if current.endswith("Z"):
+            hits.append(c)
+        current = network_map[current][instructions[state[1]]]
+        c += 1
+    start = seen[state]
+    period = c - start
+    return Walk(
+        tuple(t for t in hits if t < start),
+        start,
+        period,
+        tuple(t % period for t in hits if t >= start),
+    )
+
+
+def part2(puzzle_input: tuple[str, Network]) -> int:
     instructions, network_map = puzzle_input
-    starting_positions = [node for node in network_map if node.endswith("A")]
-    # find periods
-    periods = []
-    for current in starting_positions:
-        c = 0
-        while not current.endswith("Z"):
-            current = network_map[current][instructions[c % len(instructions)]]
-            c += 1
-        period = c
-        # check that time to first hit is actually a period
-        assert period % len(instructions) == 0
-        z = current
-        for c in range(period, 2 * period):
-            current = network_map[current][instructions[c % len(instructions)]]
-        assert current == z
-        periods.append(period)
-    return math.lcm(*periods)
+    walks = [
+        walk(node, instructions, network_map)
+        for node in network_map
+        if node.endswith("A")
+    ]
+    # before all the walks are periodic, by direct check
+    start = max(w.start for w in walks)
+    for t in range(start):
+        if all(t in w for w in walks):
+            return t
+    solutions = [
+        lift(solution, start)
+        for residues in product(*(w.residues for w in walks))
+        if (solution := crt(zip(residues, (w.period for w in walks))))
+    ]
+    if not solutions:
+        raise RuntimeError("No solution found")
+    return min(solutions)
 
 
 def main() -> None:
@@ -1,4 +1,14 @@
-from collections.abc import Iterator
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid, flood_fill  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
 
 
 def read_input(input_file) -> list[str]:
@@ -8,20 +18,14 @@ def read_input(input_file) -> list[str]:
 
 class Pipes:
     def __init__(self, grid: list[str]) -> None:
-        self.grid = grid
-        self.start = self._find_start()
-
-    def _find_start(self) -> tuple[int, int]:
-        for i, row in enumerate(self.grid):
-            try:
-                return (i, row.index("S"))
-            except ValueError:
-                continue
-        raise ValueError("No start found")
+        # the walk along the loop reads single tiles, which is faster from
+        # the strings than from the array
+        self.lines = grid
+        self.grid = Grid.from_lines(grid)
+        self.start = self.grid.find("S")
 
     def _get_neighbor_pipes(self, i: int, j: int) -> list[tuple[int, int]]:
-        c = self.grid[i][j]
-        match c:
+        match self.lines[i][j]:
             case "S":
                 neighbors = [
                     (k, m)
@@ -47,11 +51,7 @@ class Pipes:
                 neighbors = [(i + 1, j), (i, j + 1)]
             case ".":
                 neighbors = []
-        return [
-            (k, m)
-            for k, m in neighbors
-            if 0 <= k < len(self.grid) and 0 <= m < len(self.grid[0])
-        ]
+        return [(k, m) for k, m in neighbors if self.grid.in_bounds(k, m)]
 
     def find_loop(self) -> tuple[int, set[tuple[int, int]]]:
         visited = set()
@@ -71,49 +71,25 @@ class Pipes:
             to_visit = next_step
         return d, visited
 
-    def _get_neighbors(self, i: int, j: int) -> Iterator[tuple[int, int]]:
-        if i > 0:
-            yield (i - 1, j)
-        if i < len(self.grid) - 1:
-            yield (i + 1, j)
-        if j > 0:
-            yield (i, j - 1)
-        if j < len(self.grid[i]) - 1:
-            yield (i, j + 1)
-
-    def triple_grid(self) -> list[list[int]]:
-        new_grid = [
-            [0 for _ in range(3) for _ in row]
-            for _ in range(3)
-            for row in self.grid
-        ]
+    def triple_grid(self) -> np.ndarray:
+        # each tile becomes 3x3 cells, so that the outside also reaches the
+        # gaps between adjacent pipes
+        new_grid = np.zeros(
+            (3 * self.grid.height, 3 * self.grid.width), dtype=np.uint8
+        )
         _, loop = self.find_loop()
         for i, j in loop:
-            new_grid[3 * i][3 * j] = 1
+            new_grid[3 * i, 3 * j] = 1
             for k, m in self._get_neighbor_pipes(i, j):
                 di, dj = k - i, m - j
-                new_grid[3 * i + di][3 * j + dj] = 1
+                new_grid[3 * i + di, 3 * j + dj] = 1
         # fill external component
-        to_visit = {(0, 0)}
-        while to_visit:
-            i, j = to_visit.pop()
-            new_grid[i][j] = 1
-            for di, dj in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                try:
-                    if new_grid[i + di][j + dj] == 0:
-                        to_visit.add((i + di, j + dj))
-                except IndexError:
-                    pass
+        new_grid[flood_fill(new_grid == 0, (0, 0))] = 1
         return new_grid
 
     def find_enclosed_tiles(self) -> int:
         triple_grid = self.triple_grid()
-        return sum(
-            1
-            for i, row in enumerate(self.grid)
-            for j in range(len(row))
-            if triple_grid[3 * i][3 * j] == 0
-        )
+        return int((triple_grid[::3, ::3] == 0).sum())
 
 
 def part1(puzzle_input: list[str]) -> int:
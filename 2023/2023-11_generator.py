@@ -0,0 +1,26 @@
+import random
+
+
+SIZES = (25, 50, 100, 200, 400)
+DENSITY = 0.02
+EMPTY = 0.05
+
+
+def generate(size: int, seed: int = 0) -> str:
+    # a size x size image with about 2% galaxies, outside a few empty rows and
+    # columns that expand
+    rng = random.Random(seed)
+    empty_rows = {i for i in range(size) if rng.random() < EMPTY}
+    empty_cols = {j for j in range(size) if rng.random() < EMPTY}
+    return "".join(
+        "".join(
+            "#"
+            if i not in empty_rows
+            and j not in empty_cols
+            and rng.random() < DENSITY
+            else "."
+            for j in range(size)
+        )
+        + "\n"
+        for i in range(size)
+    )
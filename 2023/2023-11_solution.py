@@ -1,3 +1,16 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
+
 def read_input(input_file) -> list[str]:
     with open(input_file, "r") as f:
         return f.read().splitlines()
@@ -5,48 +18,30 @@ def read_input(input_file) -> list[str]:
 
 class Image:
     def __init__(self, grid: list[str], scale: int = 2) -> None:
-        self.grid = grid
+        self.grid = Grid.from_lines(grid)
         self.scale = scale
-        assert all(len(row) == len(grid[0]) for row in grid)
-        self.galaxies = tuple(self._find_galaxies())
-        self.empty_rows = tuple(self._iter_empty_rows())
-        self.empty_cols = tuple(self._iter_empty_cols())
-
-    @property
-    def m(self) -> int:
-        assert all(len(row) == len(self.grid[0]) for row in self.grid)
-        return len(self.grid[0])
-
-    def _iter_empty_rows(self):
-        for i, row in enumerate(self.grid):
-            if not any(c == "#" for c in row):
-                yield i
-
-    def _iter_empty_cols(self):
-        for j in range(self.m):
-            if not any(row[j] == "#" for row in self.grid):
-                yield j
-
-    def _find_galaxies(self):
-        for i, row in enumerate(self.grid):
-            for j, c in enumerate(row):
-                if c == "#":
-                    yield (i, j)
-
-    def total_distance(self):
+        galaxies = self.grid.cells == ord("#")
+        self.galaxies = np.argwhere(galaxies)
+        self.empty_rows = np.flatnonzero(~galaxies.any(axis=1))
+        self.empty_cols = np.flatnonzero(~galaxies.any(axis=0))
+
+    def expanded(self, axis: int) -> np.ndarray:
+        # galaxy coordinates along axis after the expansion
+        empty = (self.empty_rows, self.empty_cols)[axis]
+        coords = self.galaxies[:, axis]
+        return coords + (self.scale - 1) * np.searchsorted(empty, coords)
+
+    def total_distance(self) -> int:
+        # the distances add up separately along rows and columns; once
+        # sorted, the k-th coordinate is the larger one in k pairs and the
+        # smaller one in the other n - 1 - k
         total_distance = 0
-        for i1, g1 in enumerate(self.galaxies):
-            for g2 in self.galaxies[:i1]:
-                total_distance += self.dist(*g1, *g2)
+        for axis in (0, 1):
+            coords = np.sort(self.expanded(axis))
+            k = np.arange(len(coords))
+            total_distance += int((coords * (2 * k - len(coords) + 1)).sum())
         return total_distance
 
-    def dist(self, i1, j1, i2, j2):
-        # TODO: avoid iterations by storing n_empty_rows_up_to
-        extra_space = sum(
-            i in self.empty_rows for i in range(min(i1, i2), max(i1, i2))
-        ) + sum(j in self.empty_cols for j in range(min(j1, j2), max(j1, j2)))
-        return abs(i1 - i2) + abs(j1 - j2) + (self.scale - 1) * extra_space
-
 
 def part1(puzzle_input: list[str]) -> int:
     image = Image(puzzle_input)
@@ -1,3 +1,14 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
+
 def read_input(input_file) -> list[str]:
     with open(input_file, "r") as f:
         return f.read().splitlines()
@@ -5,26 +16,29 @@ def read_input(input_file) -> list[str]:
 
 class Platform:
     def __init__(self, map: list[str]) -> None:
-        self.grid = [list(row) for row in map]
+        self.grid = Grid.from_lines(map)
 
     def tilt_north(self) -> None:
-        for i, row in enumerate(self.grid):
-            for j, c in enumerate(row):
-                if c == "O":
-                    k = i - 1
-                    while k > -1 and self.grid[k][j] == ".":
-                        k -= 1
-                    if i != k + 1:
-                        self.grid[i][j] = "."
-                        self.grid[k + 1][j] = "O"
+        rocks = self.grid.cells == ord("O")
+        rows = np.arange(self.grid.height)[:, None]
+        # each rock rolls to the first row below the closest cube above it,
+        # behind the rocks that were already above it in that stretch
+        top = np.maximum.accumulate(
+            np.where(self.grid.cells == ord("#"), rows + 1, 0), axis=0
+        )
+        above = np.cumsum(rocks, axis=0) - rocks
+        padded = np.vstack([np.zeros_like(above[:1]), above + rocks])
+        rank = above - np.take_along_axis(padded, top, axis=0)
+        i, j = np.nonzero(rocks)
+        self.grid[rocks] = ord(".")
+        self.grid[top[i, j] + rank[i, j], j] = ord("O")
 
     def total_load(self) -> int:
-        return sum(
-            (k + 1) * row.count("O") for k, row in enumerate(self.grid[::-1])
-        )
+        i, _ = np.nonzero(self.grid.cells == ord("O"))
+        return int((self.grid.height - i).sum())
 
     def rotate(self) -> None:
-        self.grid = list(map(list, zip(*self.grid[::-1])))
+        self.grid = self.grid.rotate()
 
     def cycle(self) -> None:
         for _ in range(4):
@@ -32,15 +46,15 @@ class Platform:
             self.rotate()
 
     def __str__(self) -> str:
-        return "\n".join("".join(row) for row in self.grid)
+        return str(self.grid)
 
     def cycles(self, n: int) -> None:
         seen = {}
         for i in range(n):
-            seen[str(self)] = i
+            seen[self.grid.key()] = i
             self.cycle()
-            if str(self) in seen:
-                period = i + 1 - seen[str(self)]
+            if self.grid.key() in seen:
+                period = i + 1 - seen[self.grid.key()]
                 break
         print((n - i - 1) % period)
         for _ in range((n - i - 1) % period):
@@ -1,4 +1,23 @@
+import sys
 from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.grid import Grid, shift  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
+# directions leaving a tile, for each direction a beam enters it with
+TURNS = {
+    ord("."): ((0,), (1,), (2,), (3,)),
+    ord("/"): ((3,), (2,), (1,), (0,)),
+    ord("\\"): ((1,), (0,), (3,), (2,)),
+    ord("-"): ((0,), (0, 2), (2,), (0, 2)),
+    ord("|"): ((1, 3), (1,), (1, 3), (3,)),
+}
 
 
 def read_input(input_file) -> list[str]:
@@ -11,37 +30,6 @@ class Beam:
     position: tuple[int, int]
     direction: int  # 0 = right, 1 = down, 2 = left, 3 = up
 
-    def turn_right(self) -> None:
-        self.direction = (self.direction + 1) % 4
-
-    def turn_left(self) -> None:
-        self.direction = (self.direction - 1) % 4
-
-    def is_horizontal(self) -> bool:
-        return self.direction % 2 == 0
-
-    def slash(self) -> None:
-        if self.is_horizontal():
-            self.turn_left()
-        else:
-            self.turn_right()
-
-    def backslash(self) -> None:
-        if self.is_horizontal():
-            self.turn_right()
-        else:
-            self.turn_left()
-
-    def move(self) -> None:
-        if self.direction == 0:
-            self.position = (self.position[0], self.position[1] + 1)
-        elif self.direction == 1:
-            self.position = (self.position[0] + 1, self.position[1])
-        elif self.direction == 2:
-            self.position = (self.position[0], self.position[1] - 1)
-        elif self.direction == 3:
-            self.position = (self.position[0] - 1, self.position[1])
-
 
 @dataclass(frozen=True)
 class Cave:
@@ -51,58 +39,68 @@ class Cave:
     def shape(self) -> tuple[int, int]:
         return (len(self.tiles[0]), len(self.tiles))
 
-    def in_grid(self, position: tuple[int, int]) -> bool:
+    @cached_property
+    def grid(self) -> Grid:
+        # surrounded by empty tiles, where the beams from outside start
+        empty = "." * (len(self.tiles[0]) + 2)
+        return Grid.from_lines([empty, *(f".{t}." for t in self.tiles), empty])
+
+    @cached_property
+    def stops(self) -> tuple[list[list[int]], ...]:
+        # for each direction and tile, the column (right, left) or row (down,
+        # up) of the next tile on the way that is not empty, or just outside
+        # the grid; the beams jump between those
+        blocked = ~self.grid.mask(".")
+        h, w = self.grid.shape
+        cols = np.arange(w)
+        rows = np.arange(h)[:, None]
+        right = np.minimum.accumulate(
+            np.where(blocked, cols, w)[:, ::-1], axis=1
+        )[:, ::-1]
+        down = np.minimum.accumulate(np.where(blocked, rows, h)[::-1], axis=0)[
+            ::-1
+        ]
+        left = np.maximum.accumulate(np.where(blocked, cols, -1), axis=1)
+        up = np.maximum.accumulate(np.where(blocked, rows, -1), axis=0)
         return (
-            0 <= position[0] < self.shape[0]
-            and 0 <= position[1] < self.shape[1]
+            shift(right, 0, -1, fill=w).tolist(),
+            shift(down, -1, 0, fill=h).tolist(),
+            shift(left, 0, 1, fill=-1).tolist(),
+            shift(up, 1, 0, fill=-1).tolist(),
         )
 
-    def init_beam(self) -> Beam:
-        position = (0, 0)
-        match self.tiles[0][0]:
-            case "-" | ".":
-                direction = 0
-            case "|" | "\\":
-                direction = 1
-            case "/":
-                raise ValueError("The beam leaves the grid immediately")
-            case other:
-                raise ValueError(f"Invalid starting tile: {other}")
-        return Beam(position, direction)
-
     def on(self, init: Beam | None = None) -> int:
         if init is None:
             init = Beam((0, -1), 0)
-        beams = [init]
-        energized = set()
-        seen = set()
+        h, w = self.grid.shape
+        tiles = self.grid.cells.tolist()
+        energized = np.zeros((h, w), dtype=bool)
+        start = (init.position[0] + 1, init.position[1] + 1, init.direction)
+        beams = [start]
+        seen = {start}
         while beams:
-            beam = beams.pop()
-            if str(beam) in seen:
-                continue
-            seen.add(str(beam))
-            while True:
-                energized.add(beam.position)
-                beam.move()
-                if not self.in_grid(beam.position):
-                    break
-                match self.tiles[beam.position[0]][beam.position[1]]:
-                    case "\\":
-                        beam.backslash()
-                    case "/":
-                        beam.slash()
-                    case "-" if not beam.is_horizontal():
-                        beams.append(Beam(beam.position, 0))
-                        beams.append(Beam(beam.position, 2))
-                        break
-                    case "|" if beam.is_horizontal():
-                        beams.append(Beam(beam.position, 1))
-                        beams.append(Beam(beam.position, 3))
-                        break
-                    case other:
-                        assert other in ".|-"
-        # Don't count the starting (out of bounds) position
-        return len(energized) - 1
+            i, j, d = beams.pop()
+            for direction in TURNS[tiles[i][j]][d]:
+                stop = self.stops[direction][i][j]
+                match direction:
+                    case 0:
+                        energized[i, j + 1 : stop + 1] = True
+                        i1, j1 = i, stop
+                    case 1:
+                        energized[i + 1 : stop + 1, j] = True
+                        i1, j1 = stop, j
+                    case 2:
+                        energized[i, max(stop, 0) : j] = True
+                        i1, j1 = i, stop
+                    case 3:
+                        energized[max(stop, 0) : i, j] = True
+                        i1, j1 = stop, j
+                beam = (i1, j1, direction)
+                if 0 <= i1 < h and 0 <= j1 < w and beam not in seen:
+                    seen.add(beam)
+                    beams.append(beam)
+        # don't count the border
+        return int(energized[1:-1, 1:-1].sum())
 
     def init_beams(self):
         for i in range(self.shape[0]):
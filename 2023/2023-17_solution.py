@@ -1,106 +1,80 @@
-import networkx as nx
-import tqdm
+import heapq
+import sys
+from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-def read_input(input_file) -> list[list[int]]:
+from aoc.grid import Grid  # noqa: E402
+from aoc.lazy import lazy_import  # noqa: E402
+
+np = lazy_import("numpy")
+
+
+def read_input(input_file) -> Grid:
     with open(input_file, "r") as f:
-        return [list(map(int, line)) for line in f.read().splitlines()]
+        return Grid.from_digits(f.read().splitlines())
 
 
 class Map:
     def __init__(
         self,
-        grid: list[list[int]],
+        grid: Grid,
         min_straight: int = 1,
         max_straight: int = 3,
     ):
         self.grid = grid
-        assert all(len(row) == len(grid) for row in grid)
-        self.n = len(grid)
+        assert grid.height == grid.width
+        self.n = grid.height
         self.min = min_straight
         self.max = max_straight
 
-    def cell_states(self, i: int, j: int):
-        if i == j == 0:
-            # initial state has no direction
-            yield "X", 0
-        for d in range(self.max):
-            if i - d > 0:
-                yield "D", d + 1
-            if i + d < self.n - 1:
-                yield "U", d + 1
-            if j - d > 0:
-                yield "R", d + 1
-            if j + d < self.n - 1:
-                yield "L", d + 1
-
-    def neighbors(self, i: int, j: int, d: str, nd: int):
-        if 0 < nd < self.min:
-            if d == "D" and i < self.n - 1:
-                yield (i + 1, j), ("D", nd + 1)
-            elif d == "U" and i > 0:
-                yield (i - 1, j), ("U", nd + 1)
-            elif d == "R" and j < self.n - 1:
-                yield (i, j + 1), ("R", nd + 1)
-            elif d == "L" and j > 0:
-                yield (i, j - 1), ("L", nd + 1)
-            return
-        if i < self.n - 1:
-            if d == "D":
-                if nd < self.max:
-                    yield (i + 1, j), ("D", nd + 1)
-            elif d != "U":
-                yield (i + 1, j), ("D", 1)
-        if i > 0:
-            if d == "U":
-                if nd < self.max:
-                    yield (i - 1, j), ("U", nd + 1)
-            elif d != "D":
-                yield (i - 1, j), ("U", 1)
-        if j < self.n - 1:
-            if d == "R":
-                if nd < self.max:
-                    yield (i, j + 1), ("R", nd + 1)
-            elif d != "L":
-                yield (i, j + 1), ("R", 1)
-        if j > 0:
-            if d == "L":
-                if nd < self.max:
-                    yield (i, j - 1), ("L", nd + 1)
-            elif d != "R":
-                yield (i, j - 1), ("L", 1)
-
-    def generate_graph(self) -> nx.DiGraph:
-        g = nx.DiGraph()
-        for i in range(self.n):
-            for j in range(self.n):
-                for state in self.cell_states(i, j):
-                    for neighbor in self.neighbors(i, j, *state):
-                        h = self.grid[neighbor[0][0]][neighbor[0][1]]
-                        g.add_edge(((i, j), state), neighbor, weight=h)
-        return g
-
     def min_heat_loss(self) -> int:
-        g = self.generate_graph()
-        end_nodes = [
-            ((self.n - 1, self.n - 1), s)
-            for s in self.cell_states(self.n - 1, self.n - 1)
-            if s[1] >= self.min
-        ]
-        return min(
-            nx.shortest_path_length(
-                g, ((0, 0), ("X", 0)), end_node, weight="weight"
-            )
-            for end_node in tqdm.tqdm(end_nodes)
+        # Dijkstra over (block, axis it was reached along): from each state
+        # the crucible turns and goes straight for min to max blocks, losing
+        # the heat summed with the running totals along rows and columns
+        n = self.n
+        zeros = np.zeros((n, 1), dtype=np.int64)
+        rows = np.hstack(
+            [zeros, np.cumsum(self.grid.cells, axis=1, dtype=np.int64)]
         )
-
-
-def part1(puzzle_input: list[list[int]]) -> int:
+        cols = np.hstack(
+            [zeros, np.cumsum(self.grid.cells.T, axis=1, dtype=np.int64)]
+        )
+        totals = (rows.tolist(), cols.tolist())
+        queue = [(0, 0, 0, 0), (0, 0, 0, 1)]
+        done = set()
+        while queue:
+            loss, i, j, axis = heapq.heappop(queue)
+            if i == j == n - 1:
+                return loss
+            if (i, j, axis) in done:
+                continue
+            done.add((i, j, axis))
+            # axis 0 moves along a row, axis 1 along a column
+            turn = 1 - axis
+            line, k = (i, j) if turn == 0 else (j, i)
+            total = totals[turn][line]
+            for sign in (1, -1):
+                for steps in range(self.min, self.max + 1):
+                    k1 = k + sign * steps
+                    if not 0 <= k1 < n:
+                        break
+                    if sign > 0:
+                        lost = total[k1 + 1] - total[k + 1]
+                    else:
+                        lost = total[k] - total[k1]
+                    i1, j1 = (line, k1) if turn == 0 else (k1, line)
+                    if (i1, j1, turn) not in done:
+                        heapq.heappush(queue, (loss + lost, i1, j1, turn))
+        raise ValueError("The factory cannot be reached")
+
+
+def part1(puzzle_input: Grid) -> int:
     m = Map(puzzle_input)
     return m.min_heat_loss()
 
 
-def part2(puzzle_input: list[list[int]]) -> int:
+def part2(puzzle_input: Grid) -> int:
     m = Map(puzzle_input, min_straight=4, max_straight=10)
     return m.min_heat_loss()
 
@@ -1,6 +1,11 @@
-import math
-from collections import defaultdict
+import sys
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.congruence import crt, lift  # noqa: E402
 
 
 def read_input(input_file) -> list[str]:
@@ -27,9 +32,15 @@ class FlipFlop(Module):
 @dataclass
 class Conjunction(Module):
     state: dict[str, int] = field(default_factory=dict)
+    # number of inputs whose last pulse was high
+    high: int = 0
+
+    def receive(self, source: str, value: int) -> None:
+        self.high += value - self.state[source]
+        self.state[source] = value
 
     def signal(self) -> int:
-        return int(not all(self.state.values()))
+        return int(self.high < len(self.state))
 
 
 @dataclass
@@ -50,10 +61,10 @@ class Circuit:
         final_modules = final_modules or []
         sent_low = []
 
-        pulses = [(0, "", "broadcaster")]
+        pulses = deque([(0, "", "broadcaster")])
 
         while pulses:
-            value, source, receiving = pulses.pop(0)
+            value, source, receiving = pulses.popleft()
             self.counts[value] += 1
             if receiving in final_modules and value == 0:
                 sent_low.append(receiving)
@@ -69,10 +80,9 @@ class Circuit:
                             (module.state, receiving, t) for t in targets
                         )
                 case Conjunction():
-                    module.state[source] = value
-                    pulses.extend(
-                        (module.signal(), receiving, t) for t in targets
-                    )
+                    module.receive(source, value)
+                    signal = module.signal()
+                    pulses.extend((signal, receiving, t) for t in targets)
                 case Receiver():
                     if value == 0:
                         raise LowPulseReceived
@@ -80,6 +90,19 @@ class Circuit:
                     raise ValueError("Unknown module type:", module)
         return sent_low
 
+    def upstream(self, name: str) -> set[str]:
+        # the modules sending pulses that can reach name, but the broadcaster
+        cone: set[str] = set()
+        todo = [name]
+        while todo:
+            receiving = todo.pop()
+            for source, targets in self.targets.items():
+                if receiving in targets and source not in cone:
+                    cone.add(source)
+                    todo.append(source)
+        cone.discard("broadcaster")
+        return cone
+
     def _parse(
         self, configuration: list[str]
     ) -> tuple[dict[str, Module], dict[str, set[str]]]:
@@ -128,24 +151,37 @@ def part1(puzzle_input: list[str]) -> int:
 
 def part2(puzzle_input: list[str]) -> int:
     circuit = Circuit(puzzle_input)
-    # "rx" only receives from "hb". Hardcoding the inputs to "hb",
-    # get their periods and find the lcm to get the first time hb
-    # has all high inputs. Assumes simple periodicity and no phase difference.
-    final_modules = ["rr", "js", "zb", "bs"]
-    periods: dict[str, int] = {}
+    # "rx" only receives from a conjunction, which sends it a low pulse when
+    # all of its inputs are high. Each input sends a high pulse when it
+    # receives a low one: time the first two for each input, and solve for
+    # the first press at which they all happen, as congruences. Waiting for
+    # the second hits doubles the presses simulated compared to assuming
+    # the first hit is also the period. When the inputs are driven by
+    # separate parts of the circuit, the broadcaster stops feeding the part
+    # of an input once it has its two hits.
+    (feeder,) = (name for name, t in circuit.targets.items() if "rx" in t)
+    final_modules = list(circuit.modules[feeder].state)
+    hits: dict[str, list[int]] = {name: [] for name in final_modules}
+    cones = {name: circuit.upstream(name) for name in final_modules}
+    separate = sum(map(len, cones.values())) == len(set.union(*cones.values()))
 
     c = 0
-    while True:
+    while any(len(h) < 2 for h in hits.values()):
         try:
             modules = circuit.push_button(final_modules)
-            c += 1
-            if modules:
-                periods |= dict.fromkeys(modules, c)
-                if len(periods) == len(final_modules):
-                    break
         except LowPulseReceived:
             return c + 1
-    return math.lcm(*periods.values())
+        c += 1
+        for name in set(modules):
+            hits[name].append(c)
+            if len(hits[name]) == 2 and separate:
+                circuit.targets["broadcaster"] -= cones[name]
+    solution = crt(
+        (first, second - first) for first, second, *_ in hits.values()
+    )
+    if solution is None:
+        raise RuntimeError("No solution found")
+    return lift(solution, max(h[0] for h in hits.values()))
 
 
 def main() -> None:
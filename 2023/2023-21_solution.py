@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+import sys
 from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
 
-import networkx as nx
+nx = lazy_import("networkx")
 
 
 def read_input(input_file) -> list[str]:
@@ -1,8 +1,16 @@
+from __future__ import annotations
+
+import sys
 from dataclasses import dataclass
 from functools import cached_property
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
 
-import numpy as np
-from scipy import optimize
+np = lazy_import("numpy")
+optimize = lazy_import("scipy.optimize")
 
 
 def read_input(input_file) -> list[str]:
@@ -1,6 +1,16 @@
-import networkx as nx
-import numpy as np
-from scipy import optimize, sparse
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.lazy import lazy_import  # noqa: E402
+
+nx = lazy_import("networkx")
+np = lazy_import("numpy")
+optimize = lazy_import("scipy.optimize")
+sparse = lazy_import("scipy.sparse")
 
 
 def read_input(input_file) -> list[str]:
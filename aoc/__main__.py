@@ -0,0 +1,253 @@
+import argparse
+from pathlib import Path
+
+from aoc import (
+    bench,
+    parallel,
+    profiling,
+    runner,
+    scaling,
+    startup,
+    timings,
+)
+from aoc.cache import MAX_AGE, MAX_BYTES, AnswerCache
+from aoc.solutions import discover
+
+
+def add_selection(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-y", "--year", type=int, action="append", default=[], dest="years"
+    )
+    parser.add_argument(
+        "-d", "--day", type=int, action="append", default=[], dest="days"
+    )
+    parser.add_argument(
+        "-p",
+        "--part",
+        type=int,
+        action="append",
+        choices=(1, 2),
+        dest="parts",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    days = discover(args.years, args.days)
+    cache = None if args.no_cache else AnswerCache()
+    kwargs = dict(
+        trace_memory=args.memory, quiet=not args.verbose, cache=cache
+    )
+    if args.jobs is None:
+        results = runner.run(days, args.parts or (1, 2), **kwargs)
+    else:
+        results = parallel.run(
+            days, args.parts or (1, 2), max_workers=args.jobs, **kwargs
+        )
+    results = runner.report(results)
+    if not args.memory:
+        timings.record(results)
+    if cache is not None:
+        cache.evict()
+    return int(any(r.error is not None for r in results))
+
+
+def benchmark(args: argparse.Namespace) -> int:
+    days = discover(args.years, args.days)
+    baseline = bench.load_baseline(args.baseline)
+    benchmarks, regressions = bench.report(
+        bench.benchmark(days, args.parts or (1, 2), args.repeat, args.budget),
+        baseline,
+        args.threshold,
+    )
+    if args.save:
+        bench.save_baseline(benchmarks, args.baseline)
+    return int(bool(regressions))
+
+
+def manage_cache(args: argparse.Namespace) -> int:
+    cache = AnswerCache(
+        max_bytes=int(args.max_size * 1024**2), max_age=args.max_age * 86400
+    )
+    removed = cache.clear() if args.clear else cache.evict()
+    entries = cache.entries()
+    size = sum(stat.st_size for _, stat in entries)
+    print(
+        f"removed {removed} answers, {len(entries)} cached "
+        f"({runner.format_bytes(size)}) in {cache.directory}"
+    )
+    return 0
+
+
+def import_times(args: argparse.Namespace) -> int:
+    startups = startup.report(
+        startup.measure_all(discover(args.years, args.days))
+    )
+    return int(any(s.error is not None for s in startups))
+
+
+def profile(args: argparse.Namespace) -> int:
+    profiles = profiling.report(
+        profiling.profile(
+            discover(args.years, args.days),
+            args.parts or (1, 2),
+            args.output_dir,
+            args.interval,
+            quiet=not args.verbose,
+        ),
+        args.top,
+    )
+    return int(any(p.error is not None for p in profiles))
+
+
+def scale(args: argparse.Namespace) -> int:
+    scalings = scaling.report(
+        scaling.scale(
+            discover(args.years, args.days),
+            args.parts or (1, 2),
+            args.sizes,
+            args.seed,
+            args.budget,
+        )
+    )
+    if args.plot is not None:
+        scaling.plot(scalings, args.plot)
+    return int(any(s.error is not None for s in scalings))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m aoc")
+    subparsers = parser.add_subparsers(required=True)
+
+    run_parser = subparsers.add_parser(
+        "run", help="run and time solutions in a single process"
+    )
+    add_selection(run_parser)
+    run_parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace peak memory per part with tracemalloc (slower)",
+    )
+    run_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        const=0,
+        help="run parts in a process pool, longest first (default: all cores)",
+    )
+    run_parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="recompute answers instead of using the answer cache",
+    )
+    run_parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show solution output"
+    )
+    run_parser.set_defaults(func=run)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="benchmark parts against a stored baseline"
+    )
+    add_selection(bench_parser)
+    bench_parser.add_argument(
+        "-n", "--repeat", type=int, default=5, help="runs per part"
+    )
+    bench_parser.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help="stop repeating a part after this many seconds",
+    )
+    bench_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative slowdown of the median that fails the benchmark",
+    )
+    bench_parser.add_argument(
+        "--baseline", type=Path, default=bench.BASELINE_FILE
+    )
+    bench_parser.add_argument(
+        "--save", action="store_true", help="update the baseline"
+    )
+    bench_parser.set_defaults(func=benchmark)
+
+    cache_parser = subparsers.add_parser(
+        "cache", help="evict old answers from the answer cache"
+    )
+    cache_parser.add_argument(
+        "--max-size",
+        type=float,
+        default=MAX_BYTES / 1024**2,
+        help="size limit in MiB, least recently used answers go first",
+    )
+    cache_parser.add_argument(
+        "--max-age",
+        type=float,
+        default=MAX_AGE / 86400,
+        help="evict answers unused for this many days",
+    )
+    cache_parser.add_argument(
+        "--clear", action="store_true", help="remove all answers"
+    )
+    cache_parser.set_defaults(func=manage_cache)
+
+    startup_parser = subparsers.add_parser(
+        "startup", help="time the import of each day in a fresh interpreter"
+    )
+    add_selection(startup_parser)
+    startup_parser.set_defaults(func=import_times)
+
+    profile_parser = subparsers.add_parser(
+        "profile",
+        help="profile parts, writing .pstats and collapsed stacks",
+    )
+    add_selection(profile_parser)
+    profile_parser.add_argument(
+        "-n", "--top", type=int, default=15, help="hot functions to show"
+    )
+    profile_parser.add_argument(
+        "--output-dir", type=Path, default=profiling.PROFILES_DIR
+    )
+    profile_parser.add_argument(
+        "--interval",
+        type=float,
+        default=1e-3,
+        help="stack sampling interval in seconds",
+    )
+    profile_parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show solution output"
+    )
+    profile_parser.set_defaults(func=profile)
+
+    scale_parser = subparsers.add_parser(
+        "scale",
+        help="time parts on generated inputs of growing size",
+    )
+    add_selection(scale_parser)
+    scale_parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        help="input sizes (default: the generator's SIZES)",
+    )
+    scale_parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the generators"
+    )
+    scale_parser.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help="skip larger sizes once a run takes this many seconds",
+    )
+    scale_parser.add_argument(
+        "--plot", type=Path, help="save a log-log plot of time against size"
+    )
+    scale_parser.set_defaults(func=scale)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
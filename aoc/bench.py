@@ -0,0 +1,175 @@
+import json
+import statistics
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+
+from aoc.runner import (
+    PARSE,
+    format_bytes,
+    format_error,
+    format_seconds,
+    measure,
+)
+from aoc.solutions import STATE_DIR, Day, call_args
+from aoc.timings import key
+
+BASELINE_FILE = STATE_DIR / "benchmark.json"
+
+# medians below this are dominated by noise and never count as regressions
+NOISE_FLOOR = 1e-3
+
+
+@dataclass
+class Stats:
+    runs: int
+    min: float
+    median: float
+    p95: float
+    peak: int
+
+    @classmethod
+    def from_samples(cls, samples: list[float], peak: int) -> "Stats":
+        if len(samples) > 1:
+            p95 = statistics.quantiles(samples, n=20, method="inclusive")[18]
+        else:
+            p95 = samples[0]
+        return cls(
+            len(samples), min(samples), statistics.median(samples), p95, peak
+        )
+
+
+@dataclass
+class Benchmark:
+    day: Day
+    part: int  # PARSE when the day fails to load
+    stats: Stats | None = None
+    error: str | None = None
+
+    @property
+    def label(self) -> str:
+        return "load" if self.part == PARSE else f"part{self.part}"
+
+
+def clear_caches(module: ModuleType) -> None:
+    # functools caches would turn every run after the first into a lookup
+    for obj in vars(module).values():
+        if callable(getattr(obj, "cache_clear", None)):
+            obj.cache_clear()
+
+
+def benchmark_part(
+    day: Day, part: int, repeat: int = 5, budget: float = 10.0
+) -> Benchmark:
+    func = day.parts()[part]
+    samples = []
+    # the input is parsed before every run as some parts mutate it; stop
+    # repeating once the time budget is spent so slow days run only once
+    while len(samples) < repeat and sum(samples) < budget:
+        clear_caches(day.module)
+        puzzle_input, _, _, error = measure(day.read_input)
+        if error is not None:
+            return Benchmark(day, part, error=error)
+        _, seconds, _, error = measure(func, *call_args(func, puzzle_input))
+        if error is not None:
+            return Benchmark(day, part, error=error)
+        samples.append(seconds)
+    # one extra traced run for allocations, tracing distorts the timings
+    clear_caches(day.module)
+    puzzle_input, _, _, _ = measure(day.read_input)
+    _, _, peak, _ = measure(
+        func, *call_args(func, puzzle_input), trace_memory=True
+    )
+    return Benchmark(day, part, Stats.from_samples(samples, peak))
+
+
+def benchmark(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    repeat: int = 5,
+    budget: float = 10.0,
+) -> Iterator[Benchmark]:
+    parts = tuple(parts)
+    for day in days:
+        try:
+            solutions = day.parts()
+        except Exception as e:
+            yield Benchmark(day, PARSE, error=format_error(e))
+            continue
+        for part in parts:
+            if part in solutions:
+                yield benchmark_part(day, part, repeat, budget)
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> dict[str, Stats]:
+    try:
+        with open(path, "r") as f:
+            return {k: Stats(**v) for k, v in json.load(f).items()}
+    except FileNotFoundError:
+        return {}
+
+
+def save_baseline(
+    benchmarks: Iterable[Benchmark], path: Path = BASELINE_FILE
+) -> None:
+    baseline = load_baseline(path)
+    for b in benchmarks:
+        if b.stats is not None:
+            baseline[key(b.day, b.part)] = b.stats
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(
+            {k: asdict(v) for k, v in baseline.items()},
+            f,
+            indent=1,
+            sort_keys=True,
+        )
+
+
+def is_regression(stats: Stats, baseline: Stats, threshold: float) -> bool:
+    if stats.median < NOISE_FLOOR:
+        return False
+    return stats.median > baseline.median * (1 + threshold)
+
+
+def report(
+    benchmarks: Iterable[Benchmark],
+    baseline: dict[str, Stats],
+    threshold: float = 0.2,
+    file=sys.stdout,
+) -> tuple[list[Benchmark], list[Benchmark]]:
+    print(
+        f"{'day':<9}{'part':<7}{'runs':>5}{'min':>10}{'median':>10}"
+        f"{'p95':>10}{'peak':>10}{'change':>9}",
+        file=file,
+    )
+    collected, regressions = [], []
+    for b in benchmarks:
+        collected.append(b)
+        label = f"{b.day.name:<9}{b.label:<7}"
+        if b.stats is None:
+            print(f"{label}{b.error}", file=file, flush=True)
+            continue
+        s = b.stats
+        change, flag = "", ""
+        if (previous := baseline.get(key(b.day, b.part))) is not None:
+            change = f"{s.median / previous.median - 1:+.0%}"
+            if is_regression(s, previous, threshold):
+                regressions.append(b)
+                flag = "  REGRESSION"
+        print(
+            f"{label}{s.runs:>5}{format_seconds(s.min):>10}"
+            f"{format_seconds(s.median):>10}{format_seconds(s.p95):>10}"
+            f"{format_bytes(s.peak):>10}{change:>9}{flag}",
+            file=file,
+            flush=True,
+        )
+    if regressions:
+        print(
+            f"\n{len(regressions)} parts slower than the baseline by more "
+            f"than {threshold:.0%}",
+            file=file,
+        )
+    return collected, regressions
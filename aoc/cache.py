@@ -0,0 +1,106 @@
+import ast
+import hashlib
+import os
+import pickle
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from aoc.loader import file_hash, write_pickle
+from aoc.solutions import ROOT, STATE_DIR, Day
+
+CACHE_DIR = STATE_DIR / "answers"
+MAX_BYTES = 64 * 1024**2
+MAX_AGE = 30 * 24 * 3600
+
+MISSING = object()
+
+
+def local_imports(path: Path) -> set[Path]:
+    # shared aoc modules imported by a solution, followed recursively, so that
+    # changes to the library also invalidate the answers of the days using it
+    found, todo = set(), [path]
+    while todo:
+        tree = ast.parse(todo.pop().read_text())
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                if name != "aoc" and not name.startswith("aoc."):
+                    continue
+                module = ROOT.joinpath(*name.split("."))
+                for candidate in (
+                    module.with_suffix(".py"),
+                    module / "__init__.py",
+                ):
+                    if candidate.exists() and candidate not in found:
+                        found.add(candidate)
+                        todo.append(candidate)
+    return found
+
+
+def source_hash(day: Day) -> str:
+    h = hashlib.sha256()
+    for path in [day.path, *sorted(local_imports(day.path))]:
+        h.update(file_hash(path).encode())
+    return h.hexdigest()
+
+
+@dataclass(frozen=True)
+class AnswerCache:
+    directory: Path = CACHE_DIR
+    max_bytes: int = MAX_BYTES
+    max_age: float = MAX_AGE
+
+    def key(self, day: Day, part: int) -> str:
+        input_hash = (
+            file_hash(day.input_file) if day.input_file.exists() else ""
+        )
+        key = f"{day.year}/{day.day}/{part}/{input_hash}/{source_hash(day)}"
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pickle"
+
+    def get(self, key: str) -> Any:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                answer = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return MISSING
+        # eviction drops the least recently used entries first
+        os.utime(path)
+        return answer
+
+    def set(self, key: str, answer: Any) -> None:
+        write_pickle(answer, self.path(key))
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        return [
+            (path, path.stat()) for path in self.directory.glob("*/*.pickle")
+        ]
+
+    def evict(self) -> int:
+        now = time.time()
+        entries = sorted(self.entries(), key=lambda e: e[1].st_mtime)
+        size = sum(stat.st_size for _, stat in entries)
+        n_evicted = 0
+        for path, stat in entries:
+            if now - stat.st_mtime <= self.max_age and size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= stat.st_size
+            n_evicted += 1
+        return n_evicted
+
+    def clear(self) -> int:
+        entries = self.entries()
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
@@ -0,0 +1,72 @@
+import math
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import count
+
+# (r, m) stands for t % m == r
+Congruence = tuple[int, int]
+
+
+def combine(a: Congruence, b: Congruence) -> Congruence | None:
+    # generalised CRT: the moduli need not be coprime, in which case the
+    # residues must agree modulo their gcd
+    (r1, m1), (r2, m2) = a, b
+    g = math.gcd(m1, m2)
+    if (r2 - r1) % g:
+        return None
+    m = m1 // g * m2
+    k = (r2 - r1) // g * pow(m1 // g, -1, m2 // g) % (m2 // g)
+    return (r1 + k * m1) % m, m
+
+
+def crt(congruences: Iterable[Congruence]) -> Congruence | None:
+    # the congruence equivalent to all of them, None if they are incompatible
+    solution = (0, 1)
+    for r, m in congruences:
+        solution = combine(solution, (r % m, m))
+        if solution is None:
+            return None
+    return solution
+
+
+def lift(congruence: Congruence, lower: int = 0) -> int:
+    # smallest solution not below lower
+    r, m = congruence
+    return lower + (r - lower) % m
+
+
+def sieve(
+    forbidden: Iterable[Congruence], limit: int = 1 << 20
+) -> Iterator[int]:
+    # t >= 0 matching none of the forbidden congruences, in increasing order.
+    # The residues allowed by the smallest moduli are tabulated over their
+    # lcm, while it stays within limit, and the wheel is rolled over the
+    # others.
+    residues = defaultdict(set)
+    for r, m in forbidden:
+        residues[m].add(r % m)
+    wheel, period, others = [0], 1, []
+    for m in sorted(residues):
+        new_period = math.lcm(period, m)
+        if new_period > limit:
+            others.append(m)
+            continue
+        wheel = [
+            t
+            for base in range(0, new_period, period)
+            for r in wheel
+            if (t := base + r) % m not in residues[m]
+        ]
+        period = new_period
+    # the pattern repeats over the lcm of all the moduli: if nothing matches
+    # in the first repetition, nothing ever will
+    full_period = math.lcm(period, *others)
+    found = False
+    for base in count(0, period):
+        if base == full_period and not found:
+            return
+        for r in wheel:
+            t = base + r
+            if all(t % m not in residues[m] for m in others):
+                found = True
+                yield t
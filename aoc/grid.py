@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+ndimage = lazy_import("scipy.ndimage")
+
+# (di, dj) of a step right, down, left and up, clockwise from the right
+STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+DIAGONAL_STEPS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+
+class Grid:
+    # a 2D puzzle map as a uint8 array, holding the ASCII code of each tile or
+    # small numbers such as digits or flags
+    def __init__(self, cells) -> None:
+        self.cells = np.asarray(cells, dtype=np.uint8)
+        assert self.cells.ndim == 2
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> Grid:
+        lines = [line.encode() for line in lines]
+        assert all(len(line) == len(lines[0]) for line in lines)
+        cells = np.frombuffer(b"".join(lines), dtype=np.uint8)
+        return cls(cells.reshape(len(lines), -1).copy())
+
+    @classmethod
+    def from_digits(cls, lines: Iterable[str]) -> Grid:
+        grid = cls.from_lines(lines)
+        grid.cells -= ord("0")
+        return grid
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.cells.shape
+
+    @property
+    def height(self) -> int:
+        return self.cells.shape[0]
+
+    @property
+    def width(self) -> int:
+        return self.cells.shape[1]
+
+    def __getitem__(self, key):
+        return self.cells[key]
+
+    def __setitem__(self, key, value) -> None:
+        self.cells[key] = value
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def key(self) -> bytes:
+        # hashable snapshot, e.g. to detect cycles
+        return self.cells.tobytes()
+
+    def mask(self, chars: str) -> np.ndarray:
+        return np.isin(self.cells, np.frombuffer(chars.encode(), np.uint8))
+
+    def find(self, char: str) -> tuple[int, int]:
+        found = np.argwhere(self.cells == ord(char))
+        if not len(found):
+            raise ValueError(f"{char!r} not found")
+        i, j = found[0]
+        return int(i), int(j)
+
+    def in_bounds(self, i: int, j: int) -> bool:
+        return 0 <= i < self.height and 0 <= j < self.width
+
+    def rotate(self, k: int = 1) -> Grid:
+        # k quarter turns clockwise
+        return Grid(np.rot90(self.cells, -k))
+
+
+def window(offset: int, n: int) -> slice:
+    return slice(max(offset, 0), n + min(offset, 0))
+
+
+def shift(a: np.ndarray, di: int, dj: int, fill=0) -> np.ndarray:
+    # result[i, j] = a[i - di, j - dj], with fill where that is out of bounds
+    shifted = np.full_like(a, fill)
+    h, w = a.shape
+    shifted[window(di, h), window(dj, w)] = a[window(-di, h), window(-dj, w)]
+    return shifted
+
+
+def neighbour_counts(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    # number of neighbours in mask of every cell
+    mask = mask.astype(np.uint8)
+    steps = STEPS + DIAGONAL_STEPS if diagonal else STEPS
+    return sum(shift(mask, di, dj) for di, dj in steps)
+
+
+def dilate(mask: np.ndarray, diagonal: bool = False) -> np.ndarray:
+    return mask | (neighbour_counts(mask, diagonal) > 0)
+
+
+def flood_fill(passable: np.ndarray, start: tuple[int, int]) -> np.ndarray:
+    # the cells of passable connected to start by steps up, down, left or
+    # right
+    if not passable[start]:
+        return np.zeros_like(passable, dtype=bool)
+    labels, _ = ndimage.label(passable)
+    return labels == labels[start]
+
+
+def bfs(passable: np.ndarray, start: tuple[int, int]) -> np.ndarray:
+    # fewest steps from start to each cell of passable, -1 if unreachable;
+    # each distance is one array operation over the whole grid
+    distances = np.full(passable.shape, -1, dtype=np.int64)
+    frontier = np.zeros(passable.shape, dtype=bool)
+    frontier[start] = True
+    d = 0
+    while frontier.any():
+        distances[frontier] = d
+        frontier = dilate(frontier) & passable & (distances < 0)
+        d += 1
+    return distances
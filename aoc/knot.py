@@ -0,0 +1,52 @@
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+from operator import xor
+
+from aoc.pool import default_workers
+
+SUFFIX = (17, 31, 73, 47, 23)
+
+
+def sparse_hash(
+    lengths: Iterable[int], size: int = 256, rounds: int = 1
+) -> bytearray:
+    # The buffer is rotated so that the current position is always at index
+    # 0: each reversal is then a plain slice reversed in place, and the
+    # rotation is undone at the end.
+    lengths = list(lengths)
+    knot = bytearray(range(size))
+    rotation = skip = 0
+    for _ in range(rounds):
+        for length in lengths:
+            if length > size:
+                raise ValueError(f"Length {length} longer than the knot")
+            knot[:length] = knot[:length][::-1]
+            step = (length + skip) % size
+            knot[:] = knot[step:] + knot[:step]
+            rotation = (rotation + step) % size
+            skip += 1
+    cut = size - rotation
+    return knot[cut:] + knot[:cut]
+
+
+def dense_hash(knot: bytearray) -> bytes:
+    return bytes(reduce(xor, knot[i:][:16]) for i in range(0, len(knot), 16))
+
+
+def knot_hash(key: str) -> bytes:
+    lengths = [*key.encode(), *SUFFIX]
+    return dense_hash(sparse_hash(lengths, rounds=64))
+
+
+def knot_hashes(
+    keys: Iterable[str], max_workers: int | None = None
+) -> list[bytes]:
+    # in a process pool when there is more than one core
+    keys = list(keys)
+    max_workers = max_workers or default_workers()
+    if max_workers == 1:
+        return [knot_hash(key) for key in keys]
+    with ProcessPoolExecutor(max_workers) as pool:
+        chunksize = max(len(keys) // (4 * max_workers), 1)
+        return list(pool.map(knot_hash, keys, chunksize=chunksize))
@@ -0,0 +1,23 @@
+import importlib
+import sys
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    # stands in for a module until one of its attributes is first used
+    def __getattr__(self, attr: str):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, attr)
+
+    def __dir__(self) -> list[str]:
+        return dir(importlib.import_module(self.__name__))
+
+
+def lazy_import(name: str) -> ModuleType:
+    # e.g. plt = lazy_import("matplotlib.pyplot"); annotations naming the
+    # module must not be evaluated at import, see `from __future__ import
+    # annotations`
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
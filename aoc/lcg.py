@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import closing
+from functools import cache, partial
+from itertools import islice
+
+from aoc.lazy import lazy_import
+from aoc.pool import chunked
+
+np = lazy_import("numpy")
+
+# Park-Miller generators: x -> x * factor % MODULUS
+MODULUS = 2147483647  # 2**31 - 1 (prime)
+# values computed per numpy operation
+BLOCK = 1 << 16
+# values per task sent to the process pool
+CHUNK_SIZE = 1 << 22
+
+
+@cache
+def powers(factor: int, n: int) -> np.ndarray:
+    # factor ** k % MODULUS for k = 1..n, doubling the known prefix each time
+    p = np.empty(n, dtype=np.uint64)
+    p[0] = factor
+    k = 1
+    while k < n:
+        m = min(k, n - k)
+        p[k:][:m] = p[:m] * p[k - 1] % MODULUS
+        k += m
+    return p
+
+
+def blocks(
+    start: int, factor: int, first: int, stop: int
+) -> Iterator[np.ndarray]:
+    # values first + 1 to stop of the generator, i.e. start * factor ** k for
+    # k in (first, stop], in blocks; the first value is reached by modular
+    # jump-ahead, the products all fit in 62 bits
+    x = start * pow(factor, first, MODULUS) % MODULUS
+    for i in range(first, stop, BLOCK):
+        block = np.uint64(x) * powers(factor, min(BLOCK, stop - i)) % MODULUS
+        x = int(block[-1])
+        yield block
+
+
+def count_matches(
+    a: tuple[int, int], b: tuple[int, int], n: int, first: int, stop: int
+) -> list[int]:
+    # pairs among values first + 1 to min(stop, n) of the (start, factor)
+    # generators a and b with the same low 16 bits
+    stop = min(stop, n)
+    pairs = zip(blocks(*a, first, stop), blocks(*b, first, stop))
+    return [sum(int(((x ^ y) & 0xFFFF == 0).sum()) for x, y in pairs)]
+
+
+def low_bits(
+    start: int, factor: int, multiple: int, first: int, stop: int
+) -> list[np.ndarray]:
+    # low 16 bits of the multiples of `multiple` among values first + 1 to
+    # stop
+    return [
+        np.concatenate(
+            [
+                (v[v % multiple == 0] & 0xFFFF).astype(np.uint16)
+                for v in blocks(start, factor, first, stop)
+            ]
+        )
+    ]
+
+
+def matches(
+    a: tuple[int, int],
+    b: tuple[int, int],
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> int:
+    # pairs among the first n values of the (start, factor) generators a and
+    # b with the same low 16 bits
+    n_chunks = -(-n // chunk_size)
+    chunks = chunked(
+        partial(count_matches, a, b, n), 0, chunk_size, max_workers
+    )
+    with closing(chunks):
+        return sum(islice(chunks, n_chunks))
+
+
+def filtered(
+    start: int,
+    factor: int,
+    multiple: int,
+    n: int,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> np.ndarray:
+    # low 16 bits of the first n values that are multiples of `multiple`
+    found, size = [], 0
+    chunks = chunked(
+        partial(low_bits, start, factor, multiple), 0, chunk_size, max_workers
+    )
+    with closing(chunks):
+        for chunk in chunks:
+            found.append(chunk)
+            size += len(chunk)
+            if size >= n:
+                return np.concatenate(found)[:n]
@@ -0,0 +1,90 @@
+import functools
+import hashlib
+import inspect
+import mmap
+import os
+import pickle
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, Callable
+
+# files at least this large are mapped instead of read into a buffer first
+MMAP_THRESHOLD = 1024**2
+PARSED_DIR = ".parsed"
+
+
+def read_text(path: str | os.PathLike) -> str:
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return f.read().decode()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m[:].decode()
+
+
+def read_lines(path: str | os.PathLike) -> list[str]:
+    return read_text(path).splitlines()
+
+
+def iter_lines(path: str | os.PathLike) -> Iterator[str]:
+    # one line at a time, for inputs whose records can be streamed
+    with open(path, "r") as f:
+        for line in f:
+            yield line.rstrip("\n")
+
+
+def file_hash(path: str | os.PathLike) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def write_pickle(obj: Any, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # write and rename so that parallel runs never read partial files
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    tmp.replace(path)
+
+
+def parsed_prefix(func: Callable, input_file: Path) -> Path:
+    name = f"{input_file.stem}.{func.__module__}.{func.__qualname__}"
+    return input_file.parent / PARSED_DIR / name
+
+
+def parsed_path(func: Callable, input_file: Path) -> Path:
+    # the parser's whole source file is part of the key: any edit to the
+    # solution, e.g. to a class the parser builds, invalidates the cache
+    h = hashlib.sha256()
+    h.update(file_hash(input_file).encode())
+    h.update(file_hash(inspect.getsourcefile(func)).encode())
+    prefix = parsed_prefix(func, input_file)
+    return prefix.with_name(f"{prefix.name}.{h.hexdigest()[:16]}.pickle")
+
+
+def cached_parse(func: Callable) -> Callable:
+    # for read_input functions with an expensive parse: the result is pickled
+    # next to the input file and reused while neither the input nor the
+    # solution change; non-file arguments are parsed as usual
+    @functools.wraps(func)
+    def wrapper(input_file, *args, **kwargs):
+        if args or kwargs or not isinstance(input_file, (str, os.PathLike)):
+            return func(input_file, *args, **kwargs)
+        if not os.path.isfile(input_file):
+            return func(input_file)
+        input_file = Path(input_file)
+        path = parsed_path(func, input_file)
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            # missing, or pickled by another version of the solution module
+            pass
+        parsed = func(str(input_file))
+        prefix = parsed_prefix(func, input_file)
+        for stale in prefix.parent.glob(f"{prefix.name}.*.pickle"):
+            stale.unlink(missing_ok=True)
+        write_pickle(parsed, path)
+        return parsed
+
+    return wrapper
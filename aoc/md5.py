@@ -0,0 +1,71 @@
+import hashlib
+from collections.abc import Iterator
+from functools import partial
+
+from aoc.pool import chunked
+
+# nonces per task sent to the process pool
+CHUNK_SIZE = 1 << 16
+
+
+def find_prefix(
+    salt: str, zeros: int, start: int, stop: int
+) -> list[tuple[int, bytes]]:
+    # (nonce, digest) of md5(salt + nonce) starting with `zeros` hex zeros,
+    # for nonces in [start, stop)
+    base = hashlib.md5(salt.encode())
+    full, half = divmod(zeros, 2)
+    prefix = bytes(full)
+    hits = []
+    for n in range(start, stop):
+        h = base.copy()
+        h.update(b"%d" % n)
+        digest = h.digest()
+        if digest.startswith(prefix) and (not half or digest[full] < 16):
+            hits.append((n, digest))
+    return hits
+
+
+def stretch_range(salt: str, repeats: int, start: int, stop: int) -> list[str]:
+    # md5 of salt + n for n in [start, stop), hashed again as hex repeats - 1
+    # more times
+    base = hashlib.md5(salt.encode())
+    md5 = hashlib.md5
+    hashes = []
+    for n in range(start, stop):
+        h = base.copy()
+        h.update(b"%d" % n)
+        s = h.hexdigest().encode()
+        for _ in range(repeats - 1):
+            s = md5(s).hexdigest().encode()
+        hashes.append(s.decode())
+    return hashes
+
+
+def mine(
+    salt: str,
+    zeros: int = 5,
+    start: int = 0,
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: int | None = None,
+) -> Iterator[tuple[int, bytes]]:
+    # every hit from start on, in nonce order
+    return chunked(
+        partial(find_prefix, salt, zeros), start, chunk_size, max_workers
+    )
+
+
+def stretched(
+    salt: str,
+    repeats: int = 1,
+    start: int = 0,
+    chunk_size: int | None = None,
+    max_workers: int | None = None,
+) -> Iterator[str]:
+    # the stretched hashes of start, start + 1, ...
+    if chunk_size is None:
+        # about as many hashes per chunk as when mining
+        chunk_size = max(CHUNK_SIZE // repeats, 1)
+    return chunked(
+        partial(stretch_range, salt, repeats), start, chunk_size, max_workers
+    )
@@ -0,0 +1,66 @@
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from aoc import timings
+from aoc.cache import AnswerCache
+from aoc.pool import limit_workers
+from aoc.runner import PARSE, Result, format_error, run_day
+from aoc.solutions import Day
+
+
+def run_job(
+    day: Day,
+    part: int,
+    trace_memory: bool,
+    quiet: bool,
+    cache: AnswerCache | None,
+) -> list[Result]:
+    # modules stay in the worker's sys.modules, so a worker that gets several
+    # jobs for the same day imports it once; the input is parsed per job since
+    # some parts mutate it
+    try:
+        day.module
+    except Exception as e:
+        return [Result(day, PARSE, error=format_error(e))]
+    return list(run_day(day, (part,), trace_memory, quiet, cache))
+
+
+def schedule(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    recorded: dict[str, float] | None = None,
+) -> list[tuple[Day, int]]:
+    # longest job first: the total time approaches the slowest part instead
+    # of being stretched by a slow part started last
+    if recorded is None:
+        recorded = timings.load()
+    jobs = [(day, part) for day in days for part in parts]
+    return sorted(
+        jobs,
+        key=lambda job: timings.expected_seconds(recorded, *job),
+        reverse=True,
+    )
+
+
+def run(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    trace_memory: bool = False,
+    quiet: bool = True,
+    cache: AnswerCache | None = None,
+    max_workers: int | None = None,
+) -> Iterator[Result]:
+    jobs = schedule(days, tuple(parts))
+    max_workers = max_workers or os.cpu_count() or 1
+    # the cores left to each job for pools of its own
+    inner_workers = max((os.cpu_count() or 1) // max_workers, 1)
+    with ProcessPoolExecutor(
+        max_workers, initializer=limit_workers, initargs=(inner_workers,)
+    ) as executor:
+        futures = [
+            executor.submit(run_job, day, part, trace_memory, quiet, cache)
+            for day, part in jobs
+        ]
+        for future in as_completed(futures):
+            yield from future.result()
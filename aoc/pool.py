@@ -0,0 +1,48 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import count, islice
+
+# the number of workers of pools started in this process, set in the workers
+# of an outer pool so that nested pools don't start jobs * cores processes
+WORKERS_ENV = "AOC_POOL_WORKERS"
+
+
+def default_workers() -> int:
+    return int(os.environ.get(WORKERS_ENV, 0)) or os.cpu_count() or 1
+
+
+def limit_workers(max_workers: int) -> None:
+    # as the initializer of an outer pool's workers
+    os.environ[WORKERS_ENV] = str(max_workers)
+
+
+def chunked(
+    func: Callable[[int, int], list],
+    start: int,
+    chunk_size: int,
+    max_workers: int | None = None,
+) -> Iterator:
+    # the items of func(start, stop) over consecutive chunks from start on,
+    # in order; the chunks run in a process pool, a few ahead of the one
+    # being yielded
+    max_workers = max_workers or default_workers()
+    chunks = (range(n, n + chunk_size) for n in count(start, chunk_size))
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from func(chunk.start, chunk.stop)
+        return
+    pool = ProcessPoolExecutor(max_workers)
+    try:
+        pending = deque(
+            pool.submit(func, c.start, c.stop)
+            for c in islice(chunks, 2 * max_workers)
+        )
+        while True:
+            items = pending.popleft().result()
+            c = next(chunks)
+            pending.append(pool.submit(func, c.start, c.stop))
+            yield from items
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,168 @@
+import cProfile
+import io
+import pstats
+import sys
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType
+from typing import Any, Callable
+
+from aoc.runner import format_error, format_seconds
+from aoc.solutions import STATE_DIR, Day, call_args
+
+PROFILES_DIR = STATE_DIR / "profiles"
+
+
+def call(func: Callable, args: tuple) -> Any:
+    # root frame of the sampled stacks
+    return func(*args)
+
+
+def frame_label(code: CodeType) -> str:
+    return (
+        f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+    )
+
+
+class StackSampler(threading.Thread):
+    # cProfile only records caller/callee pairs, so the stacks for flame graphs
+    # are sampled from the profiled thread instead
+    def __init__(self, thread_id: int, interval: float = 1e-3) -> None:
+        super().__init__(daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and frame.f_code is not call.__code__:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            if frame is not None and stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+    def collapsed(self) -> str:
+        # one "outer;...;inner count" line per stack, as read by flamegraph.pl,
+        # speedscope or inferno
+        return "".join(f"{s} {n}\n" for s, n in sorted(self.stacks.items()))
+
+
+@dataclass
+class Profile:
+    day: Day
+    part: int
+    stats: pstats.Stats | None = None
+    pstats_file: Path | None = None
+    collapsed_file: Path | None = None
+    error: str | None = None
+
+
+def profile_part(
+    day: Day,
+    part: int,
+    output_dir: Path = PROFILES_DIR,
+    interval: float = 1e-3,
+    quiet: bool = True,
+) -> Profile:
+    func = day.parts()[part]
+    try:
+        args = call_args(func, day.read_input())
+    except Exception as e:
+        return Profile(day, part, error=format_error(e))
+    profiler = cProfile.Profile()
+    sampler = StackSampler(threading.get_ident(), interval)
+    # let the sampler thread take the GIL about as often as it samples
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval))
+    stdout = io.StringIO() if quiet else sys.stdout
+    stderr = io.StringIO() if quiet else sys.stderr
+    error = None
+    sampler.start()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            profiler.runcall(call, func, args)
+    except Exception as e:
+        error = format_error(e)
+    finally:
+        sampler.stop()
+        sys.setswitchinterval(switch_interval)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{day.name}_part{part}"
+    stats = pstats.Stats(profiler)
+    pstats_file = output_dir / f"{stem}.pstats"
+    stats.dump_stats(pstats_file)
+    collapsed_file = output_dir / f"{stem}.collapsed"
+    collapsed_file.write_text(sampler.collapsed())
+    return Profile(day, part, stats, pstats_file, collapsed_file, error)
+
+
+def profile(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    output_dir: Path = PROFILES_DIR,
+    interval: float = 1e-3,
+    quiet: bool = True,
+) -> Iterator[Profile]:
+    parts = tuple(parts)
+    for day in days:
+        try:
+            solutions = day.parts()
+        except Exception as e:
+            yield Profile(day, 0, error=format_error(e))
+            continue
+        for part in parts:
+            if part in solutions:
+                yield profile_part(day, part, output_dir, interval, quiet)
+
+
+def hot_functions(
+    stats: pstats.Stats, n: int = 15
+) -> list[tuple[float, float, int, str]]:
+    # (own time, cumulative time, calls, function), by own time
+    rows = []
+    for (filename, line, name), (_, calls, tt, ct, _) in stats.stats.items():
+        if filename == "~":
+            # builtins, e.g. <method 'append' of 'list' objects>
+            function = name
+        else:
+            function = f"{name} ({Path(filename).name}:{line})"
+        rows.append((tt, ct, calls, function))
+    return sorted(rows, reverse=True)[:n]
+
+
+def report(
+    profiles: Iterable[Profile], n: int = 15, file=sys.stdout
+) -> list[Profile]:
+    collected = []
+    for p in profiles:
+        collected.append(p)
+        title = f"{p.day.name} part{p.part}"
+        if p.stats is None:
+            print(f"{title}: {p.error}\n", file=file)
+            continue
+        print(
+            f"{title}: {format_seconds(p.stats.total_tt)}"
+            + (f" ({p.error})" if p.error else ""),
+            file=file,
+        )
+        print(f"{'own':>9}{'total':>9}{'calls':>10}  function", file=file)
+        for tt, ct, calls, function in hot_functions(p.stats, n):
+            print(
+                f"{format_seconds(tt):>9}{format_seconds(ct):>9}"
+                f"{calls:>10}  {function}",
+                file=file,
+            )
+        print(f"-> {p.pstats_file}\n-> {p.collapsed_file}\n", file=file)
+    return collected
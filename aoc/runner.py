@@ -0,0 +1,180 @@
+import contextlib
+import io
+import resource
+import sys
+import time
+import traceback
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from aoc.cache import MISSING, AnswerCache
+from aoc.solutions import Day, call_args
+
+PARSE = 0
+
+
+@dataclass
+class Result:
+    day: Day
+    part: int  # PARSE for read_input
+    answer: Any = None
+    seconds: float = 0.0
+    peak: int | None = None
+    error: str | None = None
+    cached: bool = False
+
+    @property
+    def label(self) -> str:
+        return "parse" if self.part == PARSE else f"part{self.part}"
+
+
+def format_error(e: Exception) -> str:
+    return f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+
+
+def measure(
+    func: Callable, *args, trace_memory: bool = False, quiet: bool = True
+) -> tuple[Any, float, int | None, str | None]:
+    # solutions print progress bars and debug output; keep it out of the report
+    stdout = io.StringIO() if quiet else sys.stdout
+    stderr = io.StringIO() if quiet else sys.stderr
+    if trace_memory:
+        tracemalloc.start()
+    answer, error = None, None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+            stderr
+        ):
+            answer = func(*args)
+    except Exception as e:
+        error = format_error(e)
+        if not quiet:
+            traceback.print_exc()
+    seconds = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return answer, seconds, peak, error
+
+
+def run_day(
+    day: Day,
+    parts: Iterable[int] = (1, 2),
+    trace_memory: bool = False,
+    quiet: bool = True,
+    cache: AnswerCache | None = None,
+) -> Iterator[Result]:
+    solutions = day.parts()
+    parts = [part for part in parts if part in solutions]
+    keys, answers = {}, {}
+    if cache is not None:
+        keys = {part: cache.key(day, part) for part in parts}
+        for part in parts:
+            if (answer := cache.get(keys[part])) is not MISSING:
+                answers[part] = answer
+    # the input is only needed if some answer is not cached
+    if len(answers) < len(parts):
+        puzzle_input, seconds, peak, error = measure(
+            day.read_input, trace_memory=trace_memory, quiet=quiet
+        )
+        yield Result(day, PARSE, None, seconds, peak, error)
+        if error is not None:
+            return
+    for part in parts:
+        if part in answers:
+            yield Result(day, part, answers[part], cached=True)
+            continue
+        func = solutions[part]
+        answer, seconds, peak, error = measure(
+            func,
+            *call_args(func, puzzle_input),
+            trace_memory=trace_memory,
+            quiet=quiet,
+        )
+        if cache is not None and error is None:
+            cache.set(keys[part], answer)
+        yield Result(day, part, answer, seconds, peak, error)
+
+
+def run(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    trace_memory: bool = False,
+    quiet: bool = True,
+    cache: AnswerCache | None = None,
+) -> Iterator[Result]:
+    parts = tuple(parts)
+    for day in days:
+        try:
+            day.module
+        except Exception as e:
+            yield Result(day, PARSE, error=format_error(e))
+            continue
+        yield from run_day(day, parts, trace_memory, quiet, cache)
+
+
+def format_seconds(seconds: float) -> str:
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.0f}us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.1f}ms"
+    return f"{seconds:.2f}s"
+
+
+def format_bytes(n: int | None) -> str:
+    if n is None:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if n < 1024:
+            return f"{n:.0f}{unit}"
+        n /= 1024
+    return f"{n:.1f}GiB"
+
+
+def format_result(result: Result) -> str:
+    answer = result.error if result.error is not None else result.answer
+    answer = "" if answer is None else str(answer)
+    if len(answer) > 40:
+        answer = answer[:37] + "..."
+    seconds = "cached" if result.cached else format_seconds(result.seconds)
+    return (
+        f"{result.day.name:<9}{result.label:<7}{answer:<42}"
+        f"{seconds:>9}{format_bytes(result.peak):>10}"
+    )
+
+
+def max_rss() -> int:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def report(results: Iterable[Result], file=sys.stdout) -> list[Result]:
+    print(
+        f"{'day':<9}{'part':<7}{'answer':<42}{'time':>9}{'peak':>10}",
+        file=file,
+    )
+    collected = []
+    start = time.perf_counter()
+    for result in results:
+        print(format_result(result), file=file, flush=True)
+        collected.append(result)
+    wall = time.perf_counter() - start
+    total = sum(r.seconds for r in collected)
+    errors = sum(r.error is not None for r in collected)
+    print(
+        f"\n{len(collected)} steps in {format_seconds(wall)} "
+        f"({format_seconds(total)} summed), {errors} errors, "
+        f"max RSS {format_bytes(max_rss())}",
+        file=file,
+    )
+    slowest = sorted(collected, key=lambda r: r.seconds, reverse=True)[:5]
+    if slowest:
+        print("slowest:", file=file)
+        for result in slowest:
+            print("  " + format_result(result), file=file)
+    return collected
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import math
+import sys
+import tempfile
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from aoc.bench import clear_caches
+from aoc.lazy import lazy_import
+from aoc.runner import format_error, format_seconds, measure
+from aoc.solutions import Day, call_args
+
+plt = lazy_import("matplotlib.pyplot")
+
+# runs faster than this are mostly overhead and left out of the fit
+NOISE_FLOOR = 1e-3
+
+
+@dataclass
+class Scaling:
+    day: Day
+    part: int
+    # (input size, seconds) for every size that ran
+    points: list[tuple[int, float]] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def exponent(self) -> float | None:
+        # slope of log(time) against log(size): about 1 for linear
+        # solutions, 2 for quadratic ones and growing for exponential ones
+        points = [(n, t) for n, t in self.points if t >= NOISE_FLOOR]
+        if len(points) < 2:
+            return None
+        xs = [math.log(n) for n, _ in points]
+        ys = [math.log(t) for _, t in points]
+        x_mean, y_mean = sum(xs) / len(xs), sum(ys) / len(ys)
+        var = sum((x - x_mean) ** 2 for x in xs)
+        cov = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+        return cov / var
+
+
+def generated_input(day: Day, size: int, seed: int, directory: Path):
+    # the generated text goes through the day's own read_input, like a real
+    # input file would
+    path = directory / f"{day.name}_{size}_input.txt"
+    path.write_text(day.generator.generate(size, seed))
+    return day.module.read_input(str(path))
+
+
+def scale_part(
+    day: Day,
+    part: int,
+    sizes: Sequence[int],
+    seed: int = 0,
+    budget: float = 10.0,
+) -> Scaling:
+    func = day.parts()[part]
+    scaling = Scaling(day, part)
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            clear_caches(day.module)
+            try:
+                puzzle_input = generated_input(
+                    day, size, seed, Path(directory)
+                )
+            except Exception as e:
+                scaling.error = format_error(e)
+                break
+            _, seconds, _, error = measure(
+                func, *call_args(func, puzzle_input)
+            )
+            if error is not None:
+                scaling.error = error
+                break
+            scaling.points.append((size, seconds))
+            # sizes are increasing, the next one would only take longer
+            if seconds > budget:
+                break
+    return scaling
+
+
+def scale(
+    days: Iterable[Day],
+    parts: Iterable[int] = (1, 2),
+    sizes: Sequence[int] | None = None,
+    seed: int = 0,
+    budget: float = 10.0,
+) -> Iterator[Scaling]:
+    parts = tuple(parts)
+    for day in days:
+        try:
+            generator = day.generator
+            solutions = day.parts()
+        except Exception as e:
+            yield Scaling(day, 0, error=format_error(e))
+            continue
+        if generator is None:
+            continue
+        for part in parts:
+            if part in solutions:
+                yield scale_part(
+                    day,
+                    part,
+                    sorted(sizes or generator.SIZES),
+                    seed,
+                    budget,
+                )
+
+
+def report(scalings: Iterable[Scaling], file=sys.stdout) -> list[Scaling]:
+    collected = []
+    for s in scalings:
+        collected.append(s)
+        exponent = s.exponent
+        slope = "-" if exponent is None else f"{exponent:.2f}"
+        print(f"{s.day.name} part{s.part}: exponent {slope}", file=file)
+        for size, seconds in s.points:
+            print(f"{size:>10}{format_seconds(seconds):>10}", file=file)
+        if s.error is not None:
+            print(f"  {s.error}", file=file)
+        print(file=file, flush=True)
+    return collected
+
+
+def plot(scalings: Iterable[Scaling], path: Path) -> None:
+    fig, ax = plt.subplots()
+    for s in scalings:
+        if s.points:
+            sizes, seconds = zip(*s.points)
+            ax.loglog(sizes, seconds, "o-", label=f"{s.day.name} part{s.part}")
+    ax.set_xlabel("input size")
+    ax.set_ylabel("seconds")
+    ax.legend()
+    fig.savefig(path)
+    plt.close(fig)
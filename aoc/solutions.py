@@ -0,0 +1,121 @@
+import importlib.util
+import inspect
+import re
+import sys
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+STATE_DIR = ROOT / ".aoc"
+SOLUTION_PATTERN = re.compile(r"(?P<year>\d{4})-(?P<day>\d{2})_solution\.py")
+
+
+@dataclass(frozen=True)
+class Day:
+    year: int
+    day: int
+    path: Path
+
+    @property
+    def name(self) -> str:
+        return f"{self.year}-{self.day:02}"
+
+    @property
+    def module_name(self) -> str:
+        return f"aoc_{self.year}_{self.day:02}"
+
+    @property
+    def input_file(self) -> Path:
+        return self.path.with_name(f"{self.name}_input.txt")
+
+    @property
+    def generator_file(self) -> Path:
+        return self.path.with_name(f"{self.name}_generator.py")
+
+    @property
+    def module(self) -> ModuleType:
+        # cached in sys.modules, so each process imports a day only once
+        return load_module(self.path, self.module_name)
+
+    @property
+    def generator(self) -> ModuleType | None:
+        # generate(size, seed) returns the text of a valid input of the given
+        # size, for the days that have one
+        if not self.generator_file.exists():
+            return None
+        return load_module(
+            self.generator_file, f"{self.module_name}_generator"
+        )
+
+    def parts(self) -> dict[int, Callable]:
+        return {
+            part: func
+            for part in (1, 2)
+            if callable(func := getattr(self.module, f"part{part}", None))
+        }
+
+    def read_input(self) -> Any:
+        # Days either read "YYYY-DD_input.txt" with read_input, or hold
+        # their input in an INPUT constant, optionally parsed by read_input.
+        # Days with neither take no input at all.
+        read_input = getattr(self.module, "read_input", None)
+        if read_input is not None and self.input_file.exists():
+            return read_input(str(self.input_file))
+        if hasattr(self.module, "INPUT"):
+            if read_input is None:
+                return self.module.INPUT
+            return read_input(self.module.INPUT)
+        return None
+
+
+def load_module(path: Path, name: str) -> ModuleType:
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+def call_args(func: Callable, puzzle_input: Any) -> tuple:
+    # bind the parsed input to the positional parameters without defaults,
+    # unpacking tuples for parts such as part1(row, col)
+    n_required = sum(
+        p.default is p.empty
+        and p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+        for p in inspect.signature(func).parameters.values()
+    )
+    if n_required == 0:
+        return ()
+    if (
+        n_required > 1
+        and isinstance(puzzle_input, tuple)
+        and len(puzzle_input) == n_required
+    ):
+        return puzzle_input
+    return (puzzle_input,)
+
+
+def discover(
+    years: Iterable[int] = (),
+    days: Iterable[int] = (),
+    root: Path = ROOT,
+) -> list[Day]:
+    years, days = set(years), set(days)
+    found = []
+    for path in root.glob("[0-9][0-9][0-9][0-9]/*_solution.py"):
+        if not (match := SOLUTION_PATTERN.fullmatch(path.name)):
+            continue
+        day = Day(int(match["year"]), int(match["day"]), path)
+        if years and day.year not in years or days and day.day not in days:
+            continue
+        found.append(day)
+    return sorted(found, key=lambda d: (d.year, d.day))
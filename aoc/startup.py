@@ -0,0 +1,98 @@
+import subprocess
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+
+from aoc.runner import format_seconds
+from aoc.solutions import ROOT, Day
+
+MARKER = "aoc-startup"
+
+# imports a day module in a fresh interpreter, after the runner's own imports
+LOAD_DAY = f"""
+import sys, time
+from pathlib import Path
+from aoc.solutions import load_module
+print("{MARKER}", file=sys.stderr, flush=True)
+start = time.perf_counter()
+load_module(Path(sys.argv[1]), sys.argv[2])
+print(f"{MARKER} {{time.perf_counter() - start}}", file=sys.stderr)
+"""
+
+
+@dataclass
+class Startup:
+    day: Day
+    seconds: float = 0.0
+    # (module, cumulative seconds) of the top level imports done by the day
+    imports: list[tuple[str, float]] = field(default_factory=list)
+    error: str | None = None
+
+
+def parse_importtime(lines: Iterable[str]) -> list[tuple[str, float]]:
+    # lines look like "import time:  self [us] | cumulative | <indent>name",
+    # nested imports are indented by two more spaces per level
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit() or name.startswith("   "):
+            continue
+        imports.append((name.strip(), int(cumulative) / 1e6))
+    return sorted(imports, key=lambda i: i[1], reverse=True)
+
+
+def measure_startup(day: Day) -> Startup:
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            LOAD_DAY,
+            str(day.path),
+            day.module_name,
+        ],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    lines = process.stderr.splitlines()
+    if process.returncode or MARKER not in lines:
+        return Startup(day, error=lines[-1] if lines else "failed")
+    start = lines.index(MARKER) + 1
+    seconds = float(lines[-1].split()[1])
+    return Startup(day, seconds, parse_importtime(lines[start:-1]))
+
+
+def measure_all(days: Iterable[Day]) -> Iterator[Startup]:
+    for day in days:
+        yield measure_startup(day)
+
+
+def report(
+    startups: Iterable[Startup], n_imports: int = 3, file=sys.stdout
+) -> list[Startup]:
+    print(f"{'day':<9}{'import':>9}  heaviest imports", file=file)
+    collected = []
+    for s in startups:
+        collected.append(s)
+        if s.error is not None:
+            print(f"{s.day.name:<9}{'-':>9}  {s.error}", file=file)
+            continue
+        heaviest = ", ".join(
+            f"{name} {format_seconds(seconds)}"
+            for name, seconds in s.imports[:n_imports]
+        )
+        print(
+            f"{s.day.name:<9}{format_seconds(s.seconds):>9}  {heaviest}",
+            file=file,
+            flush=True,
+        )
+    total = sum(s.seconds for s in collected)
+    print(
+        f"\n{len(collected)} days imported in {format_seconds(total)}",
+        file=file,
+    )
+    return collected
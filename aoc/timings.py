@@ -0,0 +1,36 @@
+import json
+import math
+from collections.abc import Iterable
+from pathlib import Path
+
+from aoc.runner import PARSE, Result
+from aoc.solutions import STATE_DIR, Day
+
+TIMINGS_FILE = STATE_DIR / "timings.json"
+
+
+def key(day: Day, part: int) -> str:
+    return f"{day.name}/part{part}"
+
+
+def load(path: Path = TIMINGS_FILE) -> dict[str, float]:
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def record(results: Iterable[Result], path: Path = TIMINGS_FILE) -> None:
+    timings = load(path)
+    for result in results:
+        if result.part != PARSE and result.error is None and not result.cached:
+            timings[key(result.day, result.part)] = result.seconds
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(timings, f, indent=1, sort_keys=True)
+
+
+def expected_seconds(timings: dict[str, float], day: Day, part: int) -> float:
+    # never-timed parts might be the slowest ones, so schedule them first
+    return timings.get(key(day, part), math.inf)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from aoc.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def held_karp(
+    distances: np.ndarray,
+    start: int | None = None,
+    cycle: bool = False,
+    maximize: bool = False,
+) -> int:
+    # The shortest (or longest) path visiting every node once, from start or
+    # from any node, and back to start for a cycle, by dynamic programming
+    # over (visited set, last node) in O(2**n * n**2): best[mask, j] is the
+    # best path visiting the nodes in the bitmask and ending in j. A layer of
+    # masks with the same number of nodes is updated at a time. A fixed start
+    # is left out of the masks, which halves the table, and the table holds
+    # int32 when the costs allow: for 20 nodes the table takes 40 MB with a
+    # fixed start and 84 MB without, for a measured peak of 51 MB and 105 MB
+    # with the temporaries. Missing edges are inf.
+    distances = np.asarray(distances, dtype=np.float64)
+    n = len(distances)
+    assert distances.shape == (n, n)
+    if cycle and start is None:
+        start = 0
+    if n == 1:
+        return int(distances[0, 0]) if cycle else 0
+
+    # costs of actual paths are below bound, unreachable entries stay around
+    # worst: they are clipped back to it after each layer
+    finite = np.isfinite(distances)
+    bound = n * int(np.abs(distances[finite]).max(initial=0)) + 1
+    if bound < 1 << 28:
+        dtype, unreachable = np.int32, 1 << 29
+    else:
+        assert bound < 1 << 60
+        dtype, unreachable = np.int64, 1 << 61
+    worst, best = (-unreachable, np.max) if maximize else (unreachable, np.min)
+    distances = np.where(finite, distances, worst).astype(dtype)
+
+    if start is None:
+        nodes = np.arange(n)
+        first = np.zeros(n, dtype=dtype)
+    else:
+        nodes = np.array([i for i in range(n) if i != start])
+        first = distances[start, nodes]
+    k = len(nodes)
+    steps = distances[np.ix_(nodes, nodes)]
+
+    table = np.full((1 << k, k), worst, dtype=dtype)
+    table[1 << np.arange(k), np.arange(k)] = first
+    masks = np.arange(1 << k, dtype=np.int32)
+    sizes = np.zeros(1 << k, dtype=np.uint8)
+    for i in range(k):
+        sizes += ((masks >> i) & 1).astype(np.uint8)
+    for size in range(2, k + 1):
+        layer = masks[sizes == size]
+        for j in range(k):
+            ending = layer[(layer >> j) & 1 == 1]
+            # unreachable (mask, i) are worst, so they are never chosen
+            previous = table[ending ^ (1 << j)]
+            table[ending, j] = np.clip(
+                best(previous + steps[:, j], axis=1), -unreachable, unreachable
+            )
+
+    last = table[-1]
+    if cycle:
+        last = last + distances[nodes, start]
+    cost = int(best(last))
+    if abs(cost) >= bound:
+        raise ValueError("No route visits every node")
+    return cost
@@ -0,0 +1,416 @@
+import asyncio
+import string
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from enum import Enum
+
+# opcodes of the core, each dialect maps its mnemonics to these
+(
+    NOP,
+    SET,
+    ADD,
+    MUL,
+    DIV,
+    MOD,
+    JMP,
+    JNZ,
+    JGZ,
+    JEVEN,
+    JONE,
+    TGL,
+    SND,
+    RCV,
+    OUT,
+    BRK,
+    FUSED,
+) = range(17)
+
+# opcodes whose first operand is written to
+WRITES = {SET, ADD, MUL, DIV, MOD, RCV}
+
+
+class Status(Enum):
+    HALTED = "halted"
+    RECEIVING = "receiving"
+    OUTPUT = "output"
+    BREAKPOINT = "breakpoint"
+
+
+@dataclass(frozen=True)
+class InstructionSet:
+    registers: str
+    # mnemonic -> (opcode, operands), where an operand is either the index of
+    # an argument of the instruction or a literal, e.g. "hlf r" is r //= 2
+    mnemonics: dict[str, tuple[int, tuple[int | str, ...]]]
+    # mnemonic replacing each one when toggled by tgl
+    toggles: dict[str, str] = field(default_factory=dict)
+    # peephole patterns, tried in order at each instruction: each takes the
+    # machine and an index, and returns the length of the code it replaces
+    # and a function doing the same to the registers, or None
+    superinstructions: tuple[Callable, ...] = ()
+    # most instructions a superinstruction replaces
+    longest_superinstruction: int = 0
+
+
+def match_add_loop(words: list[list[str]]) -> tuple[str, str, int] | None:
+    # inc/dec x; dec y; jnz y -2, with the first two in either order, adds
+    # or subtracts y to x: (x, y, sign)
+    match words:
+        case [[op1, r1], [op2, r2], ["jnz", y, "-2"]]:
+            pass
+        case _:
+            return None
+    if [op2, r2] == ["dec", y]:
+        op, x = op1, r1
+    elif [op1, r1] == ["dec", y]:
+        op, x = op2, r2
+    else:
+        return None
+    if op not in ("inc", "dec") or x == y:
+        return None
+    return x, y, 1 if op == "inc" else -1
+
+
+def add_loop(machine: "Machine", i: int) -> tuple[int, Callable] | None:
+    # x += y or x -= y; y = 0
+    loop = match_add_loop(machine.source[i:][:3])
+    if loop is None or not all(map(machine.is_register, loop[:2])):
+        return None
+    x, y, sign = loop
+    x, y = machine.operand(x), machine.operand(y)
+
+    def fused(r: list[int]) -> None:
+        r[x] += sign * r[y]
+        r[y] = 0
+
+    return 3, fused
+
+
+def multiply_loop(machine: "Machine", i: int) -> tuple[int, Callable] | None:
+    # cpy b c; an add loop of c into x; dec d; jnz d -5:
+    # x += b * d or x -= b * d; c = 0; d = 0
+    match machine.source[i:][:6]:
+        case [["cpy", b, c], *inner, ["dec", d], ["jnz", e, "-5"]] if d == e:
+            pass
+        case _:
+            return None
+    loop = match_add_loop(inner)
+    if loop is None:
+        return None
+    x, y, sign = loop
+    if y != c or len({x, c, d}) < 3 or b in (x, c, d):
+        return None
+    if not all(map(machine.is_register, (x, c, d))):
+        return None
+    x, b, c, d = map(machine.operand, (x, b, c, d))
+
+    def fused(r: list[int]) -> None:
+        r[x] += sign * r[b] * r[d]
+        r[c] = 0
+        r[d] = 0
+
+    return 6, fused
+
+
+TURING_LOCK = InstructionSet(
+    registers="ab",
+    mnemonics={
+        "hlf": (DIV, (0, "2")),
+        "tpl": (MUL, (0, "3")),
+        "inc": (ADD, (0, "1")),
+        "jmp": (JMP, (0,)),
+        "jie": (JEVEN, (0, 1)),
+        "jio": (JONE, (0, 1)),
+    },
+)
+
+ASSEMBUNNY = InstructionSet(
+    registers="abcd",
+    mnemonics={
+        "cpy": (SET, (1, 0)),
+        "inc": (ADD, (0, "1")),
+        "dec": (ADD, (0, "-1")),
+        "jnz": (JNZ, (0, 1)),
+        "tgl": (TGL, (0,)),
+        "out": (OUT, (0,)),
+    },
+    toggles={
+        "inc": "dec",
+        "dec": "inc",
+        "tgl": "inc",
+        "out": "inc",
+        "jnz": "cpy",
+        "cpy": "jnz",
+    },
+    superinstructions=(multiply_loop, add_loop),
+    longest_superinstruction=6,
+)
+
+DUET = InstructionSet(
+    registers=string.ascii_lowercase,
+    mnemonics={
+        "snd": (SND, (0,)),
+        "set": (SET, (0, 1)),
+        "add": (ADD, (0, 1)),
+        "mul": (MUL, (0, 1)),
+        "mod": (MOD, (0, 1)),
+        "rcv": (RCV, (0,)),
+        "jgz": (JGZ, (0, 1)),
+    },
+)
+
+
+class Machine:
+    # Programs are compiled once to (opcode, x, y) tuples, where x and y index
+    # the register file. Immediates get a slot of their own after the
+    # registers, so that every operand is read the same way.
+    def __init__(
+        self,
+        program: Iterable[str],
+        instruction_set: InstructionSet,
+        **registers: int,
+    ) -> None:
+        self.instruction_set = instruction_set
+        self.source = [line.replace(",", "").split() for line in program]
+        self.slots = {r: i for i, r in enumerate(instruction_set.registers)}
+        self.registers = [0] * len(self.slots)
+        self.code = [self.compile(words) for words in self.source]
+        # the superinstruction fused at each position, if any
+        self.fused: list[Callable[[list[int]], None] | None] = [None] * len(
+            self.source
+        )
+        self.breakpoints: dict[int, tuple[int, int, int]] = {}
+        self.fuse(0, len(self.code))
+        self.pc = 0
+        self.outbox: deque[int] = deque()
+        for name, value in registers.items():
+            self[name] = value
+
+    def operand(self, token: str) -> int:
+        if token not in self.slots:
+            self.slots[token] = len(self.registers)
+            self.registers.append(int(token))
+        return self.slots[token]
+
+    def compile(self, words: list[str]) -> tuple[int, int, int]:
+        name, *args = words
+        try:
+            opcode, operands = self.instruction_set.mnemonics[name]
+            tokens = [args[o] if isinstance(o, int) else o for o in operands]
+        except (KeyError, IndexError):
+            raise ValueError(f"Invalid instruction: {' '.join(words)}")
+        x, y = [self.operand(t) for t in tokens] + [0] * (2 - len(tokens))
+        if opcode in WRITES and x >= len(self.instruction_set.registers):
+            # writing to an immediate, e.g. "cpy 1 2" after a tgl, is skipped
+            return (NOP, 0, 0)
+        return (opcode, x, y)
+
+    def is_register(self, token: str) -> bool:
+        return self.slots.get(token, len(self.slots)) < len(
+            self.instruction_set.registers
+        )
+
+    def load(self, i: int, instruction: tuple[int, int, int]) -> None:
+        if i in self.breakpoints:
+            self.breakpoints[i] = instruction
+        else:
+            self.code[i] = instruction
+
+    def fuse(self, start: int, stop: int) -> None:
+        # replaces the first instruction of each recognised loop in
+        # [start, stop) with a superinstruction running the whole loop; the
+        # others stay, as the program may still jump to them
+        for i in range(start, stop):
+            self.fused[i] = None
+            for superinstruction in self.instruction_set.superinstructions:
+                if fused := superinstruction(self, i):
+                    length, function = fused
+                    self.fused[i] = function
+                    self.load(i, (FUSED, i, length))
+                    break
+
+    def __getitem__(self, register: str) -> int:
+        return self.registers[self.slots[register]]
+
+    def __setitem__(self, register: str, value: int) -> None:
+        self.registers[self.slots[register]] = value
+
+    def argument(self) -> int:
+        # value of the first operand of the current instruction
+        return self.registers[self.code[self.pc][1]]
+
+    def receive(self, value: int) -> None:
+        # completes the rcv the machine is waiting at
+        self.registers[self.code[self.pc][1]] = value
+        self.pc += 1
+
+    def toggle(self, i: int) -> None:
+        if not 0 <= i < len(self.source):
+            return
+        name, *args = self.source[i]
+        self.source[i] = [self.instruction_set.toggles[name], *args]
+        # superinstructions covering i are compiled again from the source
+        longest = self.instruction_set.longest_superinstruction
+        start = max(i - longest + 1, 0)
+        for j in range(start, i + 1):
+            self.load(j, self.compile(self.source[j]))
+        self.fuse(start, i + 1)
+
+    def set_breakpoint(self, i: int) -> None:
+        self.breakpoints[i] = self.code[i]
+        self.code[i] = (BRK, 0, 0)
+
+    def run(self) -> Status:
+        # until the program halts, or stops at a rcv or breakpoint for the
+        # caller to handle
+        code, r, pc = self.code, self.registers, self.pc
+        n = len(code)
+        while 0 <= pc < n:
+            op, x, y = code[pc]
+            if op == ADD:
+                r[x] += r[y]
+            elif op == JNZ:
+                if r[x]:
+                    pc += r[y]
+                    continue
+            elif op == FUSED:
+                self.fused[x](r)
+                pc += y
+                continue
+            elif op == SET:
+                r[x] = r[y]
+            elif op == MUL:
+                r[x] *= r[y]
+            elif op == MOD:
+                r[x] %= r[y]
+            elif op == DIV:
+                r[x] //= r[y]
+            elif op == JGZ:
+                if r[x] > 0:
+                    pc += r[y]
+                    continue
+            elif op == JMP:
+                pc += r[x]
+                continue
+            elif op == JEVEN:
+                if r[x] % 2 == 0:
+                    pc += r[y]
+                    continue
+            elif op == JONE:
+                if r[x] == 1:
+                    pc += r[y]
+                    continue
+            elif op == SND:
+                self.outbox.append(r[x])
+            elif op == OUT:
+                self.outbox.append(r[x])
+                self.pc = pc + 1
+                return Status.OUTPUT
+            elif op == TGL:
+                self.toggle(pc + r[x])
+            elif op == RCV:
+                self.pc = pc
+                return Status.RECEIVING
+            elif op == BRK:
+                self.pc = pc
+                return Status.BREAKPOINT
+            pc += 1
+        self.pc = pc
+        return Status.HALTED
+
+
+class Scheduler:
+    # Runs machines that talk through message queues: whatever machine i
+    # sends goes to machine route(i), by default the next one in a ring.
+    # Each machine runs until it waits at rcv on an empty queue, and the
+    # network stops once every machine halted or waits for a message that
+    # can no longer come.
+    def __init__(
+        self,
+        machines: list[Machine],
+        route: Callable[[int], int] | None = None,
+    ) -> None:
+        self.machines = machines
+        self.route = route or (lambda i: (i + 1) % len(machines))
+        self.inboxes = [deque() for _ in machines]
+        self.sent = [0] * len(machines)
+
+    def deliver(self, i: int) -> None:
+        outbox = self.machines[i].outbox
+        self.sent[i] += len(outbox)
+        self.inboxes[self.route(i)].extend(outbox)
+        outbox.clear()
+
+    def run(self) -> None:
+        statuses = [machine.run() for machine in self.machines]
+        for i in range(len(self.machines)):
+            self.deliver(i)
+        while True:
+            progress = False
+            for i, machine in enumerate(self.machines):
+                inbox = self.inboxes[i]
+                while statuses[i] is Status.RECEIVING and inbox:
+                    machine.receive(inbox.popleft())
+                    statuses[i] = machine.run()
+                    self.deliver(i)
+                    progress = True
+            if not progress:
+                return
+
+    async def run_async(self) -> None:
+        # the same with one task per machine, awaiting its queue at rcv
+        queues = [asyncio.Queue() for _ in self.machines]
+        idle = [False] * len(self.machines)
+        halted = [False] * len(self.machines)
+        deadlock = asyncio.Event()
+
+        def check_deadlock() -> None:
+            # messages to halted machines are never read
+            if all(idle) and all(
+                q.empty() for q, h in zip(queues, halted) if not h
+            ):
+                deadlock.set()
+
+        def send(i: int) -> None:
+            outbox = self.machines[i].outbox
+            self.sent[i] += len(outbox)
+            for value in outbox:
+                queues[self.route(i)].put_nowait(value)
+            outbox.clear()
+
+        async def play(i: int) -> None:
+            machine = self.machines[i]
+            while machine.run() is Status.RECEIVING:
+                send(i)
+                if queues[i].empty():
+                    idle[i] = True
+                    check_deadlock()
+                    value = await queues[i].get()
+                    idle[i] = False
+                else:
+                    value = queues[i].get_nowait()
+                machine.receive(value)
+            send(i)
+            idle[i] = halted[i] = True
+            check_deadlock()
+
+        # until the deadlock, or until a machine fails, whose error is raised;
+        # machines halting normally don't stop the others
+        waiter = asyncio.create_task(deadlock.wait())
+        pending = {waiter}
+        pending.update(
+            asyncio.create_task(play(i)) for i in range(len(queues))
+        )
+        try:
+            while not waiter.done():
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                errors = [e for task in done if (e := task.exception())]
+                if errors:
+                    raise errors[0]
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,23 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aoc.solutions import discover  # noqa: E402
+
+firewall = next(iter(discover([2017], [13]))).module
+
+
+def test_example() -> None:
+    scanners = [(0, 3), (1, 2), (4, 4), (6, 4)]
+    assert firewall.part1(scanners) == 24
+    assert firewall.part2(scanners) == 10
+
+
+def test_range_one_always_catches() -> None:
+    scanners = [(0, 3), (2, 1), (4, 4)]
+    assert firewall.part1(scanners) == 2 * 1
+    with pytest.raises(RuntimeError):
+        firewall.part2(scanners)